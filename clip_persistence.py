@@ -3,14 +3,76 @@ Clip Persistence Manager
 Handles saving and loading clip data to/from files.
 """
 
+import hashlib
 import json
 import os
 import logging
+import threading
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional - large files fall back to a full in-memory parse
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    # msgspec is optional - fall back to parse + validate_data
+    msgspec = None
+
+# Clip files above this size are parsed incrementally when ijson is
+# available, keeping memory bounded for huge imported clip lists
+STREAM_PARSE_THRESHOLD = 8 * 1024 * 1024
+
 logger = logging.getLogger(__name__)
 
+# Keys every clip dictionary must contain
+_CLIP_KEYS = ('name', 'start', 'end')
+_REQUIRED_CLIP_KEYS = frozenset(_CLIP_KEYS)
+_GET_CLIP_FIELDS = itemgetter(*_CLIP_KEYS)
+
+
+def _serialize(data: Dict) -> bytes:
+    """Serialize save data to indented JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _deserialize(payload: bytes) -> Dict:
+    """Parse JSON bytes into a dictionary (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+if msgspec is not None:
+    # Precompiled schema: decoding validates structure in the same C-level
+    # pass as parsing, so no separate validate_data walk is needed
+    class _ClipStruct(msgspec.Struct):
+        name: str
+        start: str
+        end: str
+
+    class _ClipFileStruct(msgspec.Struct):
+        version: str
+        clips: List[_ClipStruct]
+        video_path: Optional[str] = None
+        output_directory: Optional[str] = None
+        timestamp: Optional[str] = None
+
+    _CLIP_FILE_DECODER = msgspec.json.Decoder(_ClipFileStruct)
+
 
 class ClipPersistenceManager:
     """
@@ -21,6 +83,9 @@ class ClipPersistenceManager:
 
     FILE_VERSION = "1.0"
 
+    # How long to wait after the last edit before writing the recovery file
+    RECOVERY_DEBOUNCE_SECONDS = 0.5
+
     def __init__(self, recovery_file_path: str):
         """
         Initialize the persistence manager.
@@ -30,6 +95,21 @@ class ClipPersistenceManager:
         """
         self.recovery_file = recovery_file_path
 
+        # Cache of the parsed recovery file keyed by (mtime_ns, size) so
+        # has_recovery + load_recovery only parse the file once.
+        # Holds ((mtime_ns, size), data) where data is None for invalid files.
+        self._recovery_cache = None
+
+        # Digest of the last recovery content written, used to skip
+        # no-op autosaves entirely (the timestamp field is excluded)
+        self._last_recovery_digest = None
+
+        # Debounce state: save_recovery stores the latest snapshot here and
+        # arms a timer so bursts of edits collapse into a single write
+        self._pending_lock = threading.Lock()
+        self._pending_recovery = None
+        self._recovery_timer = None
+
         # Ensure recovery directory exists
         recovery_dir = os.path.dirname(recovery_file_path)
         if recovery_dir:
@@ -52,8 +132,37 @@ class ClipPersistenceManager:
         try:
             data = self._create_save_data(clips, video_path, output_path)
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Skip the write entirely when autosaving unchanged content;
+            # the timestamp is excluded so it doesn't defeat the comparison
+            if file_path == self.recovery_file:
+                content = {k: v for k, v in data.items() if k != 'timestamp'}
+                digest = hashlib.blake2b(_serialize(content), digest_size=16).digest()
+                if digest == self._last_recovery_digest:
+                    logger.debug("Recovery content unchanged, skipping write")
+                    return True
+
+            # Serialize once and write in a single call instead of letting
+            # json.dump issue many small writes through the file object.
+            # Write to a temp file and replace atomically so a crash
+            # mid-write can never corrupt an existing recovery file.
+            payload = _serialize(data)
+            tmp_path = file_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+
+            # Data we wrote ourselves is structurally valid by construction,
+            # so seed the cache with it directly - the next has_recovery /
+            # load_recovery then skips re-reading and re-validating the file
+            if file_path == self.recovery_file:
+                self._last_recovery_digest = digest
+                try:
+                    file_stat = os.stat(file_path)
+                    self._recovery_cache = ((file_stat.st_mtime_ns, file_stat.st_size), data)
+                except OSError:
+                    self._recovery_cache = None
 
             logger.info(f"Saved {len(clips)} clips to {file_path}")
             return True
@@ -74,16 +183,28 @@ class ClipPersistenceManager:
             or None if load failed
         """
         try:
-            if not os.path.exists(file_path):
+            # Single stat doubles as the existence check (EAFP, no
+            # exists()+open() race)
+            try:
+                file_size = os.path.getsize(file_path)
+            except OSError:
                 logger.warning(f"File does not exist: {file_path}")
                 return None
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            if not self.validate_data(data):
-                logger.error(f"Invalid data format in {file_path}")
-                return None
+            # Stream-parse very large files so memory stays bounded and
+            # invalid clips are rejected without reading the whole file
+            if ijson is not None and file_size > STREAM_PARSE_THRESHOLD:
+                data = self._load_streaming(file_path)
+                if data is None:
+                    logger.error(f"Invalid data format in {file_path}")
+                    return None
+            else:
+                with open(file_path, 'rb') as f:
+                    data = self._parse_validated(f.read())
+
+                if data is None:
+                    logger.error(f"Invalid data format in {file_path}")
+                    return None
 
             logger.info(f"Loaded {len(data.get('clips', []))} clips from {file_path}")
             return data
@@ -92,30 +213,109 @@ class ClipPersistenceManager:
             logger.error(f"Failed to load clips from {file_path}: {e}", exc_info=True)
             return None
 
+    def _load_streaming(self, file_path: str) -> Optional[Dict]:
+        """
+        Incrementally parse and validate a clip file with ijson.
+
+        Clips are checked as they stream by, so a malformed entry aborts
+        the load early instead of after a full parse.
+
+        Args:
+            file_path: Path to the file to load
+
+        Returns:
+            Parsed data dictionary, or None if the data is invalid
+        """
+        data = {}
+        clips = []
+        clip = None
+
+        with open(file_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'clips.item':
+                    if event == 'start_map':
+                        clip = {}
+                    elif event == 'end_map':
+                        if not (_REQUIRED_CLIP_KEYS <= clip.keys()):
+                            return None
+                        clips.append(clip)
+                        clip = None
+                elif clip is not None and prefix.startswith('clips.item.'):
+                    clip[prefix[len('clips.item.'):]] = value
+                elif prefix and '.' not in prefix and event in ('string', 'number', 'null'):
+                    # Top-level scalar fields (version, video_path, ...)
+                    data[prefix] = value
+
+        if 'version' not in data:
+            return None
+
+        data['clips'] = clips
+        return data
+
     def save_recovery(self, clips: List[Dict], video_path: Optional[str],
                       output_path: Optional[str]) -> bool:
         """
         Auto-save current state to recovery file.
 
+        The write is debounced: the snapshot is stored and flushed to disk
+        once no further edits arrive for RECOVERY_DEBOUNCE_SECONDS, so a
+        burst of edits costs a single serialization. Use flush_recovery()
+        to force the pending state to disk immediately.
+
         Args:
             clips: List of clip dictionaries
             video_path: Path to the video file (can be None)
             output_path: Path to the output directory (can be None)
 
         Returns:
-            True if save was successful, False otherwise
+            True if the save was scheduled successfully, False otherwise
         """
         try:
             # Don't save empty recovery files
             if not clips and not video_path:
                 return True
 
-            return self.save_to_file(self.recovery_file, clips, video_path, output_path)
+            with self._pending_lock:
+                self._pending_recovery = (clips, video_path, output_path)
+                if self._recovery_timer is not None:
+                    self._recovery_timer.cancel()
+                self._recovery_timer = threading.Timer(
+                    self.RECOVERY_DEBOUNCE_SECONDS, self.flush_recovery
+                )
+                self._recovery_timer.daemon = True
+                self._recovery_timer.start()
+
+            return True
 
         except Exception as e:
             logger.error(f"Failed to save recovery: {e}", exc_info=True)
             return False
 
+    def flush_recovery(self) -> bool:
+        """
+        Write any pending recovery snapshot to disk immediately.
+
+        Returns:
+            True if there was nothing pending or the write succeeded,
+            False on error
+        """
+        try:
+            with self._pending_lock:
+                if self._recovery_timer is not None:
+                    self._recovery_timer.cancel()
+                    self._recovery_timer = None
+                pending = self._pending_recovery
+                self._pending_recovery = None
+
+            if pending is None:
+                return True
+
+            return self.save_to_file(self.recovery_file, *pending)
+
+        except Exception as e:
+            logger.error(f"Failed to flush recovery: {e}", exc_info=True)
+            return False
+
     def load_recovery(self) -> Optional[Dict]:
         """
         Load the recovery file if it exists.
@@ -127,7 +327,11 @@ class ClipPersistenceManager:
             if not self.has_recovery():
                 return None
 
-            return self.load_from_file(self.recovery_file)
+            # has_recovery just parsed (or reused) the recovery file, so
+            # reuse the cached dict instead of reading it a second time
+            data = self._recovery_cache[1]
+            logger.info(f"Loaded {len(data.get('clips', []))} clips from {self.recovery_file}")
+            return data
 
         except Exception as e:
             logger.error(f"Failed to load recovery: {e}", exc_info=True)
@@ -141,9 +345,20 @@ class ClipPersistenceManager:
             True if successful or file doesn't exist, False on error
         """
         try:
-            if os.path.exists(self.recovery_file):
+            # Cancel any debounced autosave so it can't resurrect the file
+            with self._pending_lock:
+                if self._recovery_timer is not None:
+                    self._recovery_timer.cancel()
+                    self._recovery_timer = None
+                self._pending_recovery = None
+
+            self._recovery_cache = None
+            self._last_recovery_digest = None
+            try:
                 os.remove(self.recovery_file)
                 logger.info("Recovery file cleared")
+            except FileNotFoundError:
+                pass
             return True
 
         except Exception as e:
@@ -158,18 +373,48 @@ class ClipPersistenceManager:
             True if recovery file exists and is valid, False otherwise
         """
         try:
-            if not os.path.exists(self.recovery_file):
-                return False
+            file_stat = os.stat(self.recovery_file)
+        except OSError:
+            return False
 
-            # Quick validation - try to load and check format
-            with open(self.recovery_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self._recovery_cache is not None and self._recovery_cache[0] == cache_key:
+            return self._recovery_cache[1] is not None
 
-            return self.validate_data(data)
+        try:
+            # Quick validation - try to load and check format
+            with open(self.recovery_file, 'rb') as f:
+                data = self._parse_validated(f.read())
 
         except Exception as e:
             logger.warning(f"Recovery file exists but is invalid: {e}")
-            return False
+            data = None
+
+        self._recovery_cache = (cache_key, data)
+        return data is not None
+
+    def _parse_validated(self, payload: bytes) -> Optional[Dict]:
+        """
+        Parse clip-file bytes and validate their structure.
+
+        When msgspec is available, the precompiled schema parses and
+        validates in a single pass; otherwise a plain parse is followed
+        by validate_data.
+
+        Args:
+            payload: Raw JSON bytes
+
+        Returns:
+            Parsed data dictionary, or None if the data is invalid
+        """
+        if msgspec is not None:
+            try:
+                return msgspec.to_builtins(_CLIP_FILE_DECODER.decode(payload))
+            except msgspec.DecodeError:
+                return None
+
+        data = _deserialize(payload)
+        return data if self.validate_data(data) else None
 
     def validate_data(self, data: Dict) -> bool:
         """
@@ -194,14 +439,16 @@ class ClipPersistenceManager:
             if not isinstance(clips, list):
                 return False
 
-            # Validate each clip has required fields
-            for clip in clips:
-                if not isinstance(clip, dict):
-                    return False
-                if not all(key in clip for key in ['name', 'start', 'end']):
-                    return False
+            if not clips:
+                return True
 
-            return True
+            # Validate each clip has required fields in one pass; exact
+            # type check plus a C-level frozenset subset test per clip
+            required = _REQUIRED_CLIP_KEYS
+            return all(
+                type(clip) is dict and required <= clip.keys()
+                for clip in clips
+            )
 
         except Exception as e:
             logger.error(f"Data validation error: {e}")
@@ -220,13 +467,10 @@ class ClipPersistenceManager:
         Returns:
             Dictionary with all save data
         """
-        # Only include basic clip info (name, start, end)
+        # Only include basic clip info (name, start, end); itemgetter pulls
+        # all three fields per clip in one C-level call
         simplified_clips = [
-            {
-                'name': clip['name'],
-                'start': clip['start'],
-                'end': clip['end']
-            }
+            dict(zip(_CLIP_KEYS, _GET_CLIP_FIELDS(clip)))
             for clip in clips
         ]
 
@@ -0,0 +1,154 @@
+"""
+Clips Table Model
+Qt item model exposing the editor's clips to a QTableView.
+"""
+
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ClipsTableModel(QAbstractTableModel):
+    """
+    Table model backed by the VideoEditor clip list.
+
+    The view pulls cell values on demand through data(), so only visible
+    rows cost anything to render - no per-cell item objects are created.
+    Rows are exposed to the view in batches through canFetchMore/fetchMore,
+    so a huge imported spreadsheet only populates what scrolling reveals.
+    Edits are routed through an edit handler installed by the GUI, which
+    applies them to the editor and refreshes the model.
+    """
+
+    HEADERS = ('Name', 'Start', 'End', 'Duration (s)')
+
+    # Rows exposed per fetchMore call
+    FETCH_BATCH = 200
+
+    def __init__(self, editor, parent=None):
+        super().__init__(parent)
+        self.editor = editor
+
+        # Callable(row, col, text) -> bool installed by the GUI to apply edits
+        self.edit_handler = None
+
+        # Snapshot of clip info dicts currently shown, sorted by start time,
+        # plus pre-formatted duration strings (vectorized in refresh)
+        self._clips_info = []
+        self._duration_strs = []
+
+        # Number of rows currently exposed to the view; grows via fetchMore
+        self._loaded = 0
+
+    def refresh(self):
+        """Re-read clip info from the editor and reset the model."""
+        self.beginResetModel()
+        self._clips_info = self.editor.get_clips_info()
+        if self._clips_info:
+            durations = np.asarray([clip['duration'] for clip in self._clips_info])
+            self._duration_strs = list(np.char.mod("%.2f", durations))
+        else:
+            self._duration_strs = []
+        # The view re-fetches what it needs after the reset
+        self._loaded = 0
+        self.endResetModel()
+
+    def insert_clip_row(self, row, clip_info):
+        """Insert a single clip row at the given position."""
+        if row <= self._loaded:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._clips_info.insert(row, clip_info)
+            self._duration_strs.insert(row, f"{clip_info['duration']:.2f}")
+            self._loaded += 1
+            self.endInsertRows()
+        else:
+            # Beyond the exposed range; the row appears via fetchMore
+            self._clips_info.insert(row, clip_info)
+            self._duration_strs.insert(row, f"{clip_info['duration']:.2f}")
+
+    def update_clip_row(self, row, clip_info):
+        """Replace the clip shown at a row and repaint just that row."""
+        self._clips_info[row] = clip_info
+        self._duration_strs[row] = f"{clip_info['duration']:.2f}"
+        if row < self._loaded:
+            # Scope the repaint to display text; no other roles change
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, len(self.HEADERS) - 1),
+                [Qt.DisplayRole, Qt.EditRole]
+            )
+
+    def remove_clip_row(self, row):
+        """Remove a single clip row."""
+        if row < self._loaded:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._clips_info[row]
+            del self._duration_strs[row]
+            self._loaded -= 1
+            self.endRemoveRows()
+        else:
+            del self._clips_info[row]
+            del self._duration_strs[row]
+
+    def clip_at(self, row):
+        """Return the clip info dict shown at the given row."""
+        return self._clips_info[row]
+
+    def clip_count(self):
+        """Return the number of backing clips, fetched or not."""
+        return len(self._clips_info)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._clips_info)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        remaining = len(self._clips_info) - self._loaded
+        batch = min(self.FETCH_BATCH, remaining)
+        if batch <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + batch - 1)
+        self._loaded += batch
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+
+        row = index.row()
+        col = index.column()
+        clip = self._clips_info[row]
+
+        if col == 0:
+            return clip['name']
+        if col == 1:
+            return clip['start']
+        if col == 2:
+            return clip['end']
+        return self._duration_strs[row]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+
+        if self.edit_handler is None:
+            return False
+
+        return bool(self.edit_handler(index.row(), index.column(), str(value)))
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
@@ -1,10 +1,21 @@
 """
 Script to create a splash screen image for PyInstaller.
 Run this once to generate the splash.png file.
+
+The generated splash.png is committed to the repo, so reruns are no-ops
+and Pillow is only needed when regenerating the image from scratch.
 """
 
-from PIL import Image, ImageDraw, ImageFont
 import os
+import sys
+
+# Skip regeneration (and the Pillow import) when the asset already exists
+output_path = os.path.join(os.path.dirname(__file__), 'splash.png')
+if os.path.exists(output_path):
+    print(f"Splash screen image already exists: {output_path}")
+    sys.exit(0)
+
+from PIL import Image, ImageDraw, ImageFont
 
 # Create image with same dimensions as splash screen
 width, height = 400, 200
@@ -53,7 +64,6 @@ bar_y = 115
 draw.rectangle([bar_x, bar_y, bar_x + bar_width, bar_y + bar_height], fill=accent_color)
 
 # Save the image
-output_path = os.path.join(os.path.dirname(__file__), 'splash.png')
 img.save(output_path)
 print(f"Splash screen image created: {output_path}")
 print(f"Image size: {width}x{height} pixels")
@@ -5,16 +5,20 @@ Provides a graphical interface for the video editor functionality
 
 import sys
 import os
+import re
+import time
+import threading
 import logging
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTableWidget, QTableWidgetItem,
+    QPushButton, QLabel, QLineEdit, QTableView, QAbstractItemView,
     QFileDialog, QMessageBox, QProgressBar, QGroupBox, QHeaderView
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from video_editor import VideoEditor
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, QSignalBlocker, QTimer, pyqtSignal
+)
 from video_player.media_player_factory import MediaPlayerFactory
-from log_viewer import LogViewerDialog
+from clips_table_model import ClipsTableModel
 from timestamp_editor import TimestampDelegate, TimestampEditor
 from clip_persistence import ClipPersistenceManager
 from persistence_ui import PersistenceUI, RecoveryAction
@@ -22,33 +26,105 @@ from persistence_ui import PersistenceUI, RecoveryAction
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Matches "SS[.mmm]", "MM:SS[.mmm]" or "HH:MM:SS[.mmm]" in one pass
+_DUR_RE = re.compile(r'^(?:(\d+):)?(?:(\d+):)?(\d+(?:\.\d+)?)$')
+
 
-class ExportWorker(QThread):
-    """Worker thread for exporting clips without blocking the GUI."""
+class ExportWorkerSignals(QObject):
+    """Signals emitted by ExportWorker (QRunnable cannot emit directly)."""
 
     progress = pyqtSignal(int, int, str)  # current, total, clip_name
-    finished = pyqtSignal(list)  # exported files
+    finished = pyqtSignal(int)  # number of exported files
     error = pyqtSignal(str)  # error message
 
+
+class ExportWorker(QRunnable):
+    """
+    Pooled worker for exporting clips without blocking the GUI.
+
+    Runs on the global QThreadPool so repeated exports reuse threads
+    instead of constructing and tearing down a QThread per run.
+    """
+
     def __init__(self, editor, output_dir):
         super().__init__()
         self.editor = editor
         self.output_dir = output_dir
+        self.signals = ExportWorkerSignals()
+        self.cancel_requested = threading.Event()
+        self._last_emit = 0.0
+        # Keep the worker alive after run() so the GUI owns its lifetime
+        self.setAutoDelete(False)
 
     def run(self):
-        """Run the export operation in a separate thread."""
+        """Run the export operation on a pool thread."""
         try:
             exported_files = self.editor.export_all_clips(
                 self.output_dir,
-                progress_callback=self.on_progress
+                progress_callback=self.on_progress,
+                cancel_event=self.cancel_requested
             )
-            self.finished.emit(exported_files)
+            # Emit just the count; the file list stays on the editor as
+            # last_export_files instead of being marshalled across threads
+            self.signals.finished.emit(len(exported_files))
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+    def cancel(self):
+        """Request a cooperative stop; remaining clips are skipped."""
+        self.cancel_requested.set()
 
     def on_progress(self, current, total, clip_name):
-        """Callback for export progress."""
-        self.progress.emit(current, total, clip_name)
+        """
+        Callback for export progress.
+
+        Emissions are rate-limited to ~20 Hz: every cross-thread signal
+        costs a queued event on the GUI side, which adds up when many
+        short clips complete in a burst. The final update always goes out.
+        """
+        now = time.monotonic()
+        if now - self._last_emit < 0.05 and current < total:
+            return
+        self._last_emit = now
+        self.signals.progress.emit(current, total, clip_name)
+
+
+class ImportWorkerSignals(QObject):
+    """Signals emitted by ImportWorker (QRunnable cannot emit directly)."""
+
+    progress = pyqtSignal(int, int)  # rows done, total rows
+    finished = pyqtSignal(dict)  # import statistics
+    error = pyqtSignal(str)  # error message
+
+
+class ImportWorker(QRunnable):
+    """
+    Pooled worker that parses a clips spreadsheet off the GUI thread.
+
+    Large CSV/xlsx imports go through pandas/openpyxl, which would
+    freeze the window if run on the GUI thread.
+    """
+
+    def __init__(self, editor, file_path, clear_existing):
+        super().__init__()
+        self.editor = editor
+        self.file_path = file_path
+        self.clear_existing = clear_existing
+        self.signals = ImportWorkerSignals()
+        # Keep the worker alive after run() so the GUI owns its lifetime
+        self.setAutoDelete(False)
+
+    def run(self):
+        """Run the import operation on a pool thread."""
+        try:
+            stats = self.editor.import_clips_from_file(
+                self.file_path,
+                self.clear_existing,
+                progress_cb=self.signals.progress.emit
+            )
+            self.signals.finished.emit(stats)
+        except Exception as e:
+            self.signals.error.emit(str(e))
 
 
 class VideoEditorGUI(QMainWindow):
@@ -56,10 +132,49 @@ class VideoEditorGUI(QMainWindow):
 
     def __init__(self):
         super().__init__()
+
+        # Imported here rather than at module scope: video_editor pulls in
+        # moviepy and pandas, which dominate cold-start time
+        from video_editor import VideoEditor
+
         self.editor = VideoEditor()
         self.output_dir = None
         self.export_worker = None
-        self.updating_table = False  # Flag to prevent recursive updates
+        self.export_running = False
+        self.import_worker = None
+
+        # Last (start, duration) / (start, end) text pairs handled by the
+        # derived-field handlers, so repeated textChanged bounces skip the
+        # parse/format round trip when nothing relevant changed
+        self._last_dur_inputs = None
+        self._last_end_inputs = None
+
+        # File dialogs are created once on first use and reused, so the
+        # platform shell state behind them is only initialized once per
+        # purpose; reuse also keeps each dialog's last directory
+        self._open_video_dlg = None
+        self._import_dlg = None
+        self._output_dir_dlg = None
+
+        # Monotonic counter for auto-generated clip names; O(1) per
+        # mark-end instead of counting all clips each time
+        self._next_clip_id = 1
+
+        # True while the import worker is mutating editor.clips off the
+        # GUI thread; clip-mutating controls are disabled meanwhile
+        self._import_running = False
+
+        # Export progress updates are coalesced: workers overwrite the
+        # pending tuple and this timer applies the latest one at ~10 Hz,
+        # so many small clips finishing fast don't flood the event loop
+        self._status_pending = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # Last value pushed to the progress bar; repeated ticks with the
+        # same value skip the setValue/style-repolish path entirely
+        self._last_pb_value = -1
 
         # Set up persistence
         recovery_dir = os.path.join(os.path.expanduser("~"), ".videoeditor")
@@ -108,12 +223,12 @@ class VideoEditorGUI(QMainWindow):
         right_layout = QVBoxLayout()
 
         # Add clip section
-        add_clip_group = self.create_add_clip_section()
-        right_layout.addWidget(add_clip_group)
+        self.add_clip_group = self.create_add_clip_section()
+        right_layout.addWidget(self.add_clip_group)
 
         # Clips list section
-        clips_group = self.create_clips_list_section()
-        right_layout.addWidget(clips_group)
+        self.clips_group = self.create_clips_list_section()
+        right_layout.addWidget(self.clips_group)
 
         # Export section
         export_group = self.create_export_section()
@@ -132,16 +247,16 @@ class VideoEditorGUI(QMainWindow):
         file_menu = menubar.addMenu('&File')
 
         # Save Clips action
-        save_clips_action = file_menu.addAction('&Save Clips As...')
-        save_clips_action.triggered.connect(self.save_clips_as)
-        save_clips_action.setShortcut('Ctrl+S')
-        save_clips_action.setStatusTip('Save clips to file')
+        self.save_clips_action = file_menu.addAction('&Save Clips As...')
+        self.save_clips_action.triggered.connect(self.save_clips_as)
+        self.save_clips_action.setShortcut('Ctrl+S')
+        self.save_clips_action.setStatusTip('Save clips to file')
 
         # Load Clips action
-        load_clips_action = file_menu.addAction('&Load Clips...')
-        load_clips_action.triggered.connect(self.load_clips_from_file)
-        load_clips_action.setShortcut('Ctrl+O')
-        load_clips_action.setStatusTip('Load clips from file')
+        self.load_clips_action = file_menu.addAction('&Load Clips...')
+        self.load_clips_action.triggered.connect(self.load_clips_from_file)
+        self.load_clips_action.setShortcut('Ctrl+O')
+        self.load_clips_action.setStatusTip('Load clips from file')
 
         file_menu.addSeparator()
 
@@ -163,6 +278,8 @@ class VideoEditorGUI(QMainWindow):
 
     def show_logs(self):
         """Show the log viewer dialog."""
+        from log_viewer import LogViewerDialog
+
         logger.info("Opening log viewer")
         log_dialog = LogViewerDialog(self)
         log_dialog.exec_()
@@ -211,27 +328,50 @@ class VideoEditorGUI(QMainWindow):
         group = QGroupBox("Video Player")
         layout = QVBoxLayout()
 
-        # Create video player widget
+        # The player widget itself is created lazily on first video load:
+        # constructing it imports the backend (e.g. opencv) and probes
+        # devices, which users who only import and export never need
+        self.video_player = None
+        self._player_created = False
+        self._player_layout = layout
+
+        self._player_placeholder = QLabel("Video preview appears here\nwhen a video is loaded.")
+        self._player_placeholder.setStyleSheet("padding: 20px; color: #888;")
+        self._player_placeholder.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._player_placeholder, 1)  # Stretch factor of 1 to expand
+
+        group.setLayout(layout)
+        return group
+
+    def ensure_video_player(self):
+        """
+        Create the video player widget on first use.
+
+        Returns the player, or None if no backend is available.
+        """
+        if self._player_created:
+            return self.video_player
+
+        self._player_created = True
         self.video_player = MediaPlayerFactory.create_player()
 
         if self.video_player:
             # Connect mark buttons to populate input fields
             self.video_player.mark_start_clicked.connect(self.on_mark_start)
             self.video_player.mark_end_clicked.connect(self.on_mark_end)
-            layout.addWidget(self.video_player, 1)  # Stretch factor of 1 to expand
+            self._player_layout.removeWidget(self._player_placeholder)
+            self._player_placeholder.deleteLater()
+            self._player_placeholder = None
+            self._player_layout.addWidget(self.video_player, 1)  # Stretch factor of 1 to expand
         else:
             # No player available
-            no_player_label = QLabel(
+            self._player_placeholder.setText(
                 "No video player available.\n\n"
                 "Install opencv-python for video preview:\n"
                 "pip install opencv-python"
             )
-            no_player_label.setStyleSheet("padding: 20px; color: #888;")
-            no_player_label.setAlignment(Qt.AlignCenter)
-            layout.addWidget(no_player_label, 1)  # Stretch factor of 1 to expand
 
-        group.setLayout(layout)
-        return group
+        return self.video_player
 
     def create_info_section(self):
         """Create the video information section."""
@@ -300,10 +440,10 @@ class VideoEditorGUI(QMainWindow):
         import_layout = QHBoxLayout()
         import_layout.addWidget(QLabel("Or import from file:"))
 
-        import_btn = QPushButton("Import CSV/Excel")
-        import_btn.clicked.connect(self.import_clips)
-        import_btn.setFixedWidth(150)
-        import_layout.addWidget(import_btn)
+        self.import_btn = QPushButton("Import CSV/Excel")
+        self.import_btn.clicked.connect(self.import_clips)
+        self.import_btn.setFixedWidth(150)
+        import_layout.addWidget(self.import_btn)
 
         import_layout.addStretch()
         main_layout.addLayout(import_layout)
@@ -316,26 +456,33 @@ class VideoEditorGUI(QMainWindow):
         group = QGroupBox("Clips List")
         layout = QVBoxLayout()
 
-        # Table for clips
-        self.clips_table = QTableWidget()
-        self.clips_table.setColumnCount(4)
-        self.clips_table.setHorizontalHeaderLabels(['Name', 'Start', 'End', 'Duration (s)'])
+        # Model-backed view for clips: cell values are pulled on demand for
+        # visible rows only, with no per-cell item objects
+        self.clips_model = ClipsTableModel(self.editor, self)
+        self.clips_model.edit_handler = self.handle_cell_edit
 
-        # Set column widths
+        self.clips_table = QTableView()
+        self.clips_table.setModel(self.clips_model)
+
+        # Set column widths. Timestamp/duration text has bounded width, so
+        # fixed Interactive widths avoid the measure-every-row pass that
+        # ResizeToContents does on each insertion
         header = self.clips_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.Interactive)
+        self.clips_table.setColumnWidth(1, 110)
+        self.clips_table.setColumnWidth(2, 110)
+        self.clips_table.setColumnWidth(3, 110)
 
         # Set custom delegate for timestamp columns (Start and End)
         timestamp_delegate = TimestampDelegate()
         self.clips_table.setItemDelegateForColumn(1, timestamp_delegate)  # Start column
         self.clips_table.setItemDelegateForColumn(2, timestamp_delegate)  # End column
 
-        self.clips_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.clips_table.setEditTriggers(QTableWidget.DoubleClicked)
-        self.clips_table.itemChanged.connect(self.on_table_cell_changed)
+        self.clips_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.clips_table.setEditTriggers(QAbstractItemView.DoubleClicked)
 
         layout.addWidget(self.clips_table)
 
@@ -396,12 +543,17 @@ class VideoEditorGUI(QMainWindow):
 
     def load_video(self):
         """Load a video file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Video File",
-            "",
-            "Video Files (*.mp4 *.avi *.mkv *.mov *.wmv *.flv);;All Files (*.*)"
-        )
+        if self._open_video_dlg is None:
+            self._open_video_dlg = QFileDialog(self, "Select Video File")
+            self._open_video_dlg.setFileMode(QFileDialog.ExistingFile)
+            self._open_video_dlg.setNameFilters([
+                "Video Files (*.mp4 *.avi *.mkv *.mov *.wmv *.flv)",
+                "All Files (*.*)"
+            ])
+
+        if not self._open_video_dlg.exec_():
+            return
+        file_path = self._open_video_dlg.selectedFiles()[0]
 
         if file_path:
             try:
@@ -411,8 +563,8 @@ class VideoEditorGUI(QMainWindow):
                 self.update_video_info()
                 self.refresh_clips_table()
 
-                # Load into video player if available
-                if self.video_player:
+                # Load into video player if available (created on first use)
+                if self.ensure_video_player():
                     self.video_player.load_video(file_path)
 
                 self.statusBar().showMessage(f"Video loaded: {file_path}")
@@ -453,32 +605,20 @@ class VideoEditorGUI(QMainWindow):
         if not duration:
             return None
 
-        duration = duration.strip()
-
-        try:
-            # Check if it's just a number (seconds only)
-            if ':' not in duration:
-                return float(duration)
-
-            # Split by colon
-            parts = duration.split(':')
-
-            if len(parts) == 2:
-                # MM:SS or MM:SS.mmm format
-                minutes = int(parts[0])
-                seconds = float(parts[1])
-                return minutes * 60 + seconds
-            elif len(parts) == 3:
-                # HH:MM:SS or HH:MM:SS.mmm format
-                hours = int(parts[0])
-                minutes = int(parts[1])
-                seconds = float(parts[2])
-                return hours * 3600 + minutes * 60 + seconds
-            else:
-                return None
-        except:
+        match = _DUR_RE.match(duration.strip())
+        if not match:
             return None
 
+        first, second, seconds = match.groups()
+        total = float(seconds)
+        if second is not None:
+            # HH:MM:SS[.mmm]
+            total += int(first) * 3600 + int(second) * 60
+        elif first is not None:
+            # MM:SS[.mmm]
+            total += int(first) * 60
+        return total
+
     def format_seconds_to_timestamp(self, seconds: float) -> str:
         """Format seconds to timestamp string (helper for GUI calculations)."""
         try:
@@ -494,6 +634,12 @@ class VideoEditorGUI(QMainWindow):
         if not start_time or not duration:
             return
 
+        # Skip the parse/format round trip if nothing relevant changed
+        inputs = (start_time, duration)
+        if inputs == self._last_dur_inputs:
+            return
+        self._last_dur_inputs = inputs
+
         start_seconds = self.parse_timestamp_to_seconds(start_time)
         duration_seconds = self.parse_flexible_duration(duration)
 
@@ -501,10 +647,9 @@ class VideoEditorGUI(QMainWindow):
             end_seconds = start_seconds + duration_seconds
             end_time = self.format_seconds_to_timestamp(end_seconds)
 
-            # Temporarily disconnect to avoid triggering on_end_time_changed
-            self.end_time_input.textChanged.disconnect(self.on_end_time_changed)
-            self.end_time_input.setText(end_time)
-            self.end_time_input.textChanged.connect(self.on_end_time_changed)
+            # Block signals so setText doesn't trigger on_end_time_changed
+            with QSignalBlocker(self.end_time_input):
+                self.end_time_input.setText(end_time)
 
     def on_end_time_changed(self):
         """Calculate duration when end time is changed."""
@@ -514,6 +659,12 @@ class VideoEditorGUI(QMainWindow):
         if not start_time or not end_time:
             return
 
+        # Skip the parse/format round trip if nothing relevant changed
+        inputs = (start_time, end_time)
+        if inputs == self._last_end_inputs:
+            return
+        self._last_end_inputs = inputs
+
         start_seconds = self.parse_timestamp_to_seconds(start_time)
         end_seconds = self.parse_timestamp_to_seconds(end_time)
 
@@ -521,10 +672,9 @@ class VideoEditorGUI(QMainWindow):
             duration_seconds = end_seconds - start_seconds
             duration = self.format_seconds_to_timestamp(duration_seconds)
 
-            # Temporarily disconnect to avoid triggering on_duration_changed
-            self.duration_input.textChanged.disconnect(self.on_duration_changed)
-            self.duration_input.setText(duration)
-            self.duration_input.textChanged.connect(self.on_duration_changed)
+            # Block signals so setText doesn't trigger on_duration_changed
+            with QSignalBlocker(self.duration_input):
+                self.duration_input.setText(duration)
 
     def on_mark_start(self, timestamp):
         """Handle mark start button from video player."""
@@ -536,18 +686,19 @@ class VideoEditorGUI(QMainWindow):
         self.end_time_input.setText(timestamp)
         self.statusBar().showMessage(f"End time marked: {timestamp}")
 
-        # Auto-create clip if both start and end times are set
+        # Auto-create clip if both start and end times are set. The mark
+        # buttons live in the player group and stay enabled during an
+        # import, so skip the auto-create while the worker owns the dict
         start_time = self.start_time_input.text().strip()
-        if start_time and timestamp:
-            # Generate a filler name based on clip count
-            clip_count = len(self.editor.get_clips_info()) + 1
-            filler_name = f"Clip_{clip_count}"
+        if start_time and timestamp and not self._import_running:
+            # Generate a filler name from the monotonic counter
+            filler_name = f"Clip_{self._next_clip_id}"
+            self._next_clip_id += 1
 
             try:
                 # Add clip with filler name
                 self.editor.add_clip(filler_name, start_time, timestamp)
-                self.refresh_clips_table()
-                self.update_export_button()
+                self.add_clip_row(filler_name)
 
                 # Clear the input fields for next clip
                 self.clip_name_input.clear()
@@ -575,8 +726,7 @@ class VideoEditorGUI(QMainWindow):
 
         try:
             self.editor.add_clip(clip_name, start_time, end_time)
-            self.refresh_clips_table()
-            self.update_export_button()
+            self.add_clip_row(clip_name)
 
             # Clear inputs
             self.clip_name_input.clear()
@@ -590,42 +740,41 @@ class VideoEditorGUI(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to add clip:\n{str(e)}")
             self.statusBar().showMessage("Failed to add clip")
 
-    def on_table_cell_changed(self, item):
-        """Handle cell editing in the clips table."""
-        if self.updating_table:
-            return
+    def handle_cell_edit(self, row, col, value):
+        """
+        Apply an edited cell value to the backing editor.
 
-        row = item.row()
-        col = item.column()
+        Installed as the clips model's edit handler; called from
+        ClipsTableModel.setData when the user commits an edit.
 
-        # Get all clip data from the row
-        clips_info = self.editor.get_clips_info()
-        if row >= len(clips_info):
-            return
-
-        old_clip = clips_info[row]
-        old_name = old_clip['name']
+        Returns:
+            True if the edit was applied, False otherwise
+        """
+        clip = self.clips_model.clip_at(row)
+        old_name = clip['name']
 
-        # Get current values from table
-        new_name = self.clips_table.item(row, 0).text().strip()
-        new_start = self.clips_table.item(row, 1).text().strip()
-        new_end = self.clips_table.item(row, 2).text().strip()
-        new_duration = self.clips_table.item(row, 3).text().strip()
+        new_name = clip['name']
+        new_start = clip['start']
+        new_end = clip['end']
+        value = value.strip()
 
         try:
-            # If duration was edited (column 3), calculate new end time
-            if col == 3:
-                # Parse duration using flexible parser
-                duration_seconds = self.parse_flexible_duration(new_duration)
+            if col == 0:
+                new_name = value
+            elif col == 1:
+                new_start = value
+            elif col == 2:
+                new_end = value
+            else:
+                # Duration edited - calculate the new end time from it
+                duration_seconds = self.parse_flexible_duration(value)
                 if duration_seconds is None:
-                    raise ValueError(f"Invalid duration format: {new_duration}")
+                    raise ValueError(f"Invalid duration format: {value}")
 
-                # Parse start time
                 start_seconds = self.parse_timestamp_to_seconds(new_start)
                 if start_seconds is None:
                     raise ValueError(f"Invalid start time: {new_start}")
 
-                # Calculate new end time
                 end_seconds = start_seconds + duration_seconds
                 new_end = self.format_seconds_to_timestamp(end_seconds)
 
@@ -633,16 +782,44 @@ class VideoEditorGUI(QMainWindow):
             self.editor.edit_clip(old_name, new_name, new_start, new_end)
             self.statusBar().showMessage(f"Clip '{new_name}' updated successfully")
 
-            # Refresh to update duration and format timestamps
-            self.refresh_clips_table()
+            # Update just the edited row unless its sort position moved
+            clips_info = self.editor.get_clips_info()
+            new_row = next(
+                (i for i, c in enumerate(clips_info) if c['name'] == new_name),
+                None
+            )
+            if new_row == row:
+                self.clips_model.update_clip_row(row, clips_info[row])
+            else:
+                self.refresh_clips_table()
 
             self.auto_save()  # Auto-save after editing clip
+            return True
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to update clip:\n{str(e)}")
-            # Revert the change
-            self.refresh_clips_table()
+            # The edit never reached the editor, so the model still holds
+            # the old values and the view reverts on its own
             self.statusBar().showMessage("Failed to update clip")
+            return False
+
+    def set_clip_controls_enabled(self, enabled):
+        """
+        Enable or disable every control that can mutate the clip list.
+
+        The import worker mutates editor.clips from a pool thread;
+        while it runs, adding/removing/editing clips, saving, loading,
+        or exporting from the GUI thread would race on the same dict.
+        """
+        self._import_running = not enabled
+        self.add_clip_group.setEnabled(enabled)
+        self.clips_group.setEnabled(enabled)
+        self.save_clips_action.setEnabled(enabled)
+        self.load_clips_action.setEnabled(enabled)
+        if enabled:
+            self.update_export_button()
+        else:
+            self.export_btn.setEnabled(False)
 
     def import_clips(self):
         """Import clips from a CSV or Excel file."""
@@ -654,15 +831,19 @@ class VideoEditorGUI(QMainWindow):
             )
             return
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select CSV or Excel File",
-            "",
-            "Spreadsheet Files (*.csv *.xlsx *.xls);;CSV Files (*.csv);;Excel Files (*.xlsx *.xls);;All Files (*.*)"
-        )
-
-        if not file_path:
+        if self._import_dlg is None:
+            self._import_dlg = QFileDialog(self, "Select CSV or Excel File")
+            self._import_dlg.setFileMode(QFileDialog.ExistingFile)
+            self._import_dlg.setNameFilters([
+                "Spreadsheet Files (*.csv *.xlsx *.xls)",
+                "CSV Files (*.csv)",
+                "Excel Files (*.xlsx *.xls)",
+                "All Files (*.*)"
+            ])
+
+        if not self._import_dlg.exec_():
             return
+        file_path = self._import_dlg.selectedFiles()[0]
 
         # Ask if user wants to clear existing clips
         if self.editor.clips:
@@ -682,62 +863,113 @@ class VideoEditorGUI(QMainWindow):
         else:
             clear_existing = False
 
-        try:
-            stats = self.editor.import_clips_from_file(file_path, clear_existing)
-
-            # Show results
-            if stats['failed'] > 0:
-                error_details = "\n".join(stats['errors'][:10])  # Show first 10 errors
-                if len(stats['errors']) > 10:
-                    error_details += f"\n... and {len(stats['errors']) - 10} more errors"
-
-                QMessageBox.warning(
-                    self,
-                    "Import Complete with Errors",
-                    f"Successfully imported: {stats['success']} clip(s)\n"
-                    f"Failed: {stats['failed']} clip(s)\n\n"
-                    f"Errors:\n{error_details}"
-                )
-            else:
-                QMessageBox.information(
-                    self,
-                    "Import Successful",
-                    f"Successfully imported {stats['success']} clip(s)!"
-                )
+        # Parse off the GUI thread; for large spreadsheets the pandas read
+        # plus row loop would otherwise freeze the window. Lock out every
+        # other clip-mutating control while the worker owns the dict
+        self.set_clip_controls_enabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
 
-            self.refresh_clips_table()
-            self.auto_save()  # Auto-save after importing clips
-            self.statusBar().showMessage(
-                f"Imported {stats['success']} clips ({stats['failed']} failed)"
-            )
+        self.import_worker = ImportWorker(self.editor, file_path, clear_existing)
+        self.import_worker.signals.progress.connect(self.on_import_progress)
+        self.import_worker.signals.finished.connect(self.on_import_finished)
+        self.import_worker.signals.error.connect(self.on_import_error)
+        QThreadPool.globalInstance().start(self.import_worker)
 
-        except Exception as e:
-            QMessageBox.critical(
+        self.statusBar().showMessage("Importing clips...")
+
+    def on_import_progress(self, done, total):
+        """Handle import progress updates."""
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+        self.statusBar().showMessage(f"Importing clips: {done}/{total} rows")
+
+    def on_import_finished(self, stats):
+        """Handle import completion."""
+        self.set_clip_controls_enabled(True)
+        self.progress_bar.setVisible(False)
+
+        # Show results
+        if stats['failed'] > 0:
+            error_details = "\n".join(stats['errors'][:10])  # Show first 10 errors
+            if len(stats['errors']) > 10:
+                error_details += f"\n... and {len(stats['errors']) - 10} more errors"
+
+            QMessageBox.warning(
                 self,
-                "Import Error",
-                f"Failed to import clips:\n{str(e)}"
+                "Import Complete with Errors",
+                f"Successfully imported: {stats['success']} clip(s)\n"
+                f"Failed: {stats['failed']} clip(s)\n\n"
+                f"Errors:\n{error_details}"
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Import Successful",
+                f"Successfully imported {stats['success']} clip(s)!"
             )
-            self.statusBar().showMessage("Import failed")
 
-    def refresh_clips_table(self):
-        """Refresh the clips table."""
-        self.updating_table = True  # Prevent itemChanged signals during refresh
+        self._next_clip_id = len(self.editor.clips) + 1
+        self.refresh_clips_table()
+        self.auto_save()  # Auto-save after importing clips
+        self.statusBar().showMessage(
+            f"Imported {stats['success']} clips ({stats['failed']} failed)"
+        )
+
+    def on_import_error(self, error_msg):
+        """Handle import errors."""
+        self.set_clip_controls_enabled(True)
+        self.progress_bar.setVisible(False)
+
+        QMessageBox.critical(
+            self,
+            "Import Error",
+            f"Failed to import clips:\n{error_msg}"
+        )
+        self.statusBar().showMessage("Import failed")
 
+    def add_clip_row(self, clip_name):
+        """
+        Insert a single model row for a newly added clip.
+
+        Avoids resetting the whole model on every add; the row is placed
+        at the clip's position in the start-time-sorted clip list.
+        """
         clips_info = self.editor.get_clips_info()
-        self.clips_table.setRowCount(len(clips_info))
 
-        for row, clip in enumerate(clips_info):
-            name_item = QTableWidgetItem(clip['name'])
-            start_item = QTableWidgetItem(clip['start'])
-            end_item = QTableWidgetItem(clip['end'])
-            duration_item = QTableWidgetItem(f"{clip['duration']:.2f}")
+        # add_clip silently overwrites an existing name, in which case
+        # the model already has a row for this clip and inserting would
+        # show it twice; re-sync the whole model instead
+        if len(clips_info) == self.clips_model.clip_count():
+            self.refresh_clips_table()
+            return
 
-            self.clips_table.setItem(row, 0, name_item)
-            self.clips_table.setItem(row, 1, start_item)
-            self.clips_table.setItem(row, 2, end_item)
-            self.clips_table.setItem(row, 3, duration_item)
+        row = next(
+            (i for i, clip in enumerate(clips_info) if clip['name'] == clip_name),
+            None
+        )
+        if row is None:
+            # Fall back to a full refresh if the clip can't be located
+            self.refresh_clips_table()
+            return
 
-        self.updating_table = False
+        self.clips_model.insert_clip_row(row, clips_info[row])
+        self.update_export_button()
+
+    def remove_clip_row(self, row):
+        """Remove a single model row instead of resetting the whole model."""
+        self.clips_model.remove_clip_row(row)
+        self.update_export_button()
+
+    def refresh_clips_table(self):
+        """Refresh the clips table from the editor."""
+        # Suspend viewport updates so the model reset and the header
+        # re-measure coalesce into a single repaint
+        self.clips_table.setUpdatesEnabled(False)
+        try:
+            self.clips_model.refresh()
+        finally:
+            self.clips_table.setUpdatesEnabled(True)
         self.update_export_button()
 
     def seek_to_selected_clip(self):
@@ -748,10 +980,11 @@ class VideoEditorGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a clip to seek to")
             return
 
-        # Get start time from the second column (index 1)
+        # Read from the model's row snapshot
         row = selected_rows[0].row()
-        start_time = self.clips_table.item(row, 1).text()
-        clip_name = self.clips_table.item(row, 0).text()
+        clip = self.clips_model.clip_at(row)
+        start_time = clip['start']
+        clip_name = clip['name']
 
         # Seek the video player to this timestamp
         if self.video_player and hasattr(self.video_player, 'seek_to_timestamp'):
@@ -768,13 +1001,13 @@ class VideoEditorGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a clip to remove")
             return
 
-        # Get clip name from the first column
+        # Get clip name from the model's row snapshot
         row = selected_rows[0].row()
-        clip_name = self.clips_table.item(row, 0).text()
+        clip_name = self.clips_model.clip_at(row)['name']
 
         try:
             self.editor.remove_clip(clip_name)
-            self.refresh_clips_table()
+            self.remove_clip_row(row)
             self.auto_save()  # Auto-save after removing clip
             self.statusBar().showMessage(f"Clip '{clip_name}' removed")
         except Exception as e:
@@ -794,17 +1027,21 @@ class VideoEditorGUI(QMainWindow):
 
         if reply == QMessageBox.Yes:
             self.editor.clear_clips()
+            self._next_clip_id = 1
             self.refresh_clips_table()
             self.auto_save()  # Auto-save after clearing clips
             self.statusBar().showMessage("All clips cleared")
 
     def choose_output_dir(self):
         """Choose output directory."""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Output Directory",
-            ""
-        )
+        if self._output_dir_dlg is None:
+            self._output_dir_dlg = QFileDialog(self, "Select Output Directory")
+            self._output_dir_dlg.setFileMode(QFileDialog.Directory)
+            self._output_dir_dlg.setOption(QFileDialog.ShowDirsOnly, True)
+
+        if not self._output_dir_dlg.exec_():
+            return
+        directory = self._output_dir_dlg.selectedFiles()[0]
 
         if directory:
             self.output_dir = directory
@@ -829,44 +1066,68 @@ class VideoEditorGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select an output directory")
             return
 
-        # Disable export button and show progress bar
+        # Disable export button and show progress bar. Text paint is
+        # disabled for the duration: the status bar already carries the
+        # counts and the percentage label forces extra repaints
         self.export_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
+        self.progress_bar.setTextVisible(False)
         self.progress_bar.setValue(0)
         self.progress_bar.setMaximum(len(self.editor.clips))
+        self._last_pb_value = 0
 
-        # Create and start export worker thread
+        # Create the export worker and hand it to the shared thread pool
         self.export_worker = ExportWorker(self.editor, self.output_dir)
-        self.export_worker.progress.connect(self.on_export_progress)
-        self.export_worker.finished.connect(self.on_export_finished)
-        self.export_worker.error.connect(self.on_export_error)
-        self.export_worker.start()
+        self.export_worker.signals.progress.connect(self.on_export_progress)
+        self.export_worker.signals.finished.connect(self.on_export_finished)
+        self.export_worker.signals.error.connect(self.on_export_error)
+        self.export_running = True
+        self._status_pending = None
+        self._status_timer.start()
+        QThreadPool.globalInstance().start(self.export_worker)
 
         self.statusBar().showMessage("Exporting clips...")
 
     def on_export_progress(self, current, total, clip_name):
-        """Handle export progress updates."""
-        self.progress_bar.setValue(current)
+        """Handle export progress updates (coalesced by _flush_status)."""
+        self._status_pending = (current, total, clip_name)
+
+    def _flush_status(self):
+        """Apply the latest pending export progress to the UI."""
+        if self._status_pending is None:
+            return
+        current, total, clip_name = self._status_pending
+        self._status_pending = None
+
+        if current != self._last_pb_value:
+            self.progress_bar.setValue(current)
+            self._last_pb_value = current
         if current < total:
             self.statusBar().showMessage(f"Exporting: {clip_name} ({current + 1}/{total})")
         else:
             self.statusBar().showMessage("Export complete!")
 
-    def on_export_finished(self, exported_files):
+    def on_export_finished(self, exported_count):
         """Handle export completion."""
+        self.export_running = False
+        self._status_timer.stop()
+        self._flush_status()
         self.progress_bar.setVisible(False)
         self.export_btn.setEnabled(True)
 
         QMessageBox.information(
             self,
             "Success",
-            f"Successfully exported {len(exported_files)} clip(s) to:\n{self.output_dir}"
+            f"Successfully exported {exported_count} clip(s) to:\n{self.output_dir}"
         )
 
-        self.statusBar().showMessage(f"Exported {len(exported_files)} clips successfully")
+        self.statusBar().showMessage(f"Exported {exported_count} clips successfully")
 
     def on_export_error(self, error_msg):
         """Handle export errors."""
+        self.export_running = False
+        self._status_timer.stop()
+        self._status_pending = None
         self.progress_bar.setVisible(False)
         self.export_btn.setEnabled(True)
 
@@ -881,7 +1142,7 @@ class VideoEditorGUI(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         # Wait for export worker to finish if running
-        if self.export_worker and self.export_worker.isRunning():
+        if self.export_running:
             reply = QMessageBox.question(
                 self,
                 "Confirm",
@@ -893,8 +1154,11 @@ class VideoEditorGUI(QMainWindow):
                 event.ignore()
                 return
             else:
-                self.export_worker.terminate()
-                self.export_worker.wait()
+                # Cancel cooperatively so queued clips are skipped, then
+                # give in-flight encodes a bounded window to wind down
+                if self.export_worker:
+                    self.export_worker.cancel()
+                QThreadPool.globalInstance().waitForDone(5000)
 
         # Ask if user wants to save session for next time
         if self.editor.clips or self.editor.video_path or self.output_dir:
@@ -913,7 +1177,9 @@ class VideoEditorGUI(QMainWindow):
             elif reply == QMessageBox.No:
                 # User chose not to save - clear recovery
                 self.persistence_manager.clear_recovery()
-            # If Yes, recovery file is already saved (from auto-save), so just exit
+            else:
+                # Make sure any debounced auto-save reaches disk before exit
+                self.persistence_manager.flush_recovery()
 
         else:
             # Nothing to save, clear recovery
@@ -959,8 +1225,8 @@ class VideoEditorGUI(QMainWindow):
                 self.file_label.setText(f"Loaded: {os.path.basename(video_path)}")
                 self.update_video_info()
 
-                # Load into video player if available
-                if self.video_player:
+                # Load into video player if available (created on first use)
+                if self.ensure_video_player():
                     self.video_player.load_video(video_path)
 
             except Exception as e:
@@ -980,6 +1246,7 @@ class VideoEditorGUI(QMainWindow):
                 logger.warning(f"Failed to restore clip {clip.get('name')}: {e}")
                 # Skip invalid clips
 
+        self._next_clip_id = len(self.editor.clips) + 1
         self.refresh_clips_table()
         self.update_export_button()
         self.statusBar().showMessage("Session restored")
@@ -5,28 +5,131 @@ Displays application logs in a GUI window with auto-refresh capability.
 
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTextEdit, QLabel, QCheckBox
+    QPlainTextEdit, QLabel, QCheckBox, QSpinBox
+)
+from PyQt5.QtCore import (
+    QFileSystemWatcher, QObject, QRunnable, QThreadPool, QTimer, Qt, pyqtSignal
 )
-from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QFont
+import io
 import os
 from logging_config import get_log_file_path
 
 
+class LogTailSignals(QObject):
+    """Signals emitted by LogTailWorker (QRunnable cannot emit directly)."""
+
+    finished = pyqtSignal(str, int, bool)  # delta text, new offset, reset view
+    error = pyqtSignal(str)  # error message
+
+
+class LogTailWorker(QRunnable):
+    """
+    Reads the next chunk of the log file off the GUI thread.
+
+    Disk hiccups (network shares, antivirus scans) then stall a pool
+    thread instead of the event loop; the delta comes back via a queued
+    signal.
+    """
+
+    def __init__(self, path, last_pos, tail_only, tail_bytes, read_buffer):
+        super().__init__()
+        self.path = path
+        self.last_pos = last_pos
+        self.tail_only = tail_only
+        self.tail_bytes = tail_bytes
+        self.read_buffer = read_buffer
+        self.signals = LogTailSignals()
+
+    def run(self):
+        """Read from the stored offset and emit the delta."""
+        try:
+            # Open first, stat through the handle: one syscall fewer than
+            # exists+open and no window where rotation deletes the file
+            # in between
+            try:
+                raw = open(self.path, 'rb', buffering=self.read_buffer)
+            except FileNotFoundError:
+                self.signals.error.emit(f"Log file not found: {self.path}")
+                return
+
+            with raw:
+                size = os.fstat(raw.fileno()).st_size
+
+                # File was truncated or rotated; start over
+                reset = size < self.last_pos
+                start = 0 if reset else self.last_pos
+
+                if not reset and size == start:
+                    self.signals.finished.emit('', start, False)  # Nothing new
+                    return
+
+                # On the first read of a large file, start tail_bytes from
+                # the end and drop the partial line at the cut point
+                skip_partial_line = False
+                if start == 0 and self.tail_only and size > self.tail_bytes:
+                    start = size - self.tail_bytes
+                    skip_partial_line = True
+
+                # Decode tolerantly: the tail may end mid-way through a
+                # multi-byte UTF-8 sequence
+                raw.seek(start)
+                text = io.TextIOWrapper(raw, encoding='utf-8', errors='replace')
+                if skip_partial_line:
+                    text.readline()
+                delta = text.read()
+                new_pos = raw.tell()
+                text.detach()
+
+            self.signals.finished.emit(delta, new_pos, reset)
+        except Exception as e:
+            self.signals.error.emit(f"Error reading log file: {e}")
+
+
 class LogViewerDialog(QDialog):
     """Dialog to view application logs."""
 
+    # Cap on displayed lines; older blocks are dropped from the top
+    MAX_BLOCKS = 5000
+
+    # Buffer size for log reads; 64 KB keeps the syscall count low on
+    # large deltas compared to the default ~8 KB text-mode reads
+    READ_BUFFER = 65536
+
+    # Initial load shows only the last 512 KB so opening the viewer on a
+    # huge rotated log doesn't block the GUI reading the whole file
+    TAIL_BYTES = 512 * 1024
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.log_file_path = get_log_file_path()
+
+        # File offset of the last byte shown; refreshes only read past it
+        self._last_pos = 0
+
+        # Initial loads skip to the tail unless the user asks for it all
+        self._tail_only = True
+
+        # True while a background read is in flight; stops rapid
+        # fileChanged events from queueing piles of workers
+        self._reading = False
+
+        # (mtime_ns, size) of the file at the last dispatched read; an
+        # unchanged signature means there is nothing new and no worker
+        # needs to run
+        self._last_sig = None
+
         self.init_ui()
 
         # Load initial content
         self.refresh_logs()
 
-        # Set up auto-refresh timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh_logs)
+        # Kernel-driven auto-refresh: the watcher fires only when the log
+        # actually changes, instead of a timer polling every 2 seconds.
+        # Change bursts are coalesced through a 100 ms single-shot.
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_log_file_changed)
+        self._refresh_pending = False
 
     def init_ui(self):
         """Initialize the user interface."""
@@ -43,10 +146,18 @@ class LogViewerDialog(QDialog):
         header_layout.addStretch()
         layout.addLayout(header_layout)
 
-        # Log text display
-        self.log_text = QTextEdit()
+        # Log text display. QPlainTextEdit is built for append-style log
+        # workloads; the block cap keeps huge logs from growing the
+        # document without bound
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setLineWrapMode(QTextEdit.NoWrap)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_text.setMaximumBlockCount(self.MAX_BLOCKS)
+
+        # Appends never need undo history, and recentering on every
+        # append would force extra layout passes
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setCenterOnScroll(False)
 
         # Use monospace font for better log readability
         font = QFont("Courier New", 9)
@@ -63,6 +174,16 @@ class LogViewerDialog(QDialog):
         self.auto_refresh_checkbox.stateChanged.connect(self.toggle_auto_refresh)
         controls_layout.addWidget(self.auto_refresh_checkbox)
 
+        # Displayed-line cap; lowering it trims memory and repaint cost,
+        # raising it keeps more history around
+        controls_layout.addWidget(QLabel("Max lines:"))
+        self.max_lines_spin = QSpinBox()
+        self.max_lines_spin.setRange(1000, 100000)
+        self.max_lines_spin.setSingleStep(1000)
+        self.max_lines_spin.setValue(self.MAX_BLOCKS)
+        self.max_lines_spin.valueChanged.connect(self.log_text.setMaximumBlockCount)
+        controls_layout.addWidget(self.max_lines_spin)
+
         controls_layout.addStretch()
 
         # Refresh button
@@ -70,6 +191,11 @@ class LogViewerDialog(QDialog):
         refresh_btn.clicked.connect(self.refresh_logs)
         controls_layout.addWidget(refresh_btn)
 
+        # Load full file button (initial load shows only the tail)
+        load_full_btn = QPushButton("Load Full File")
+        load_full_btn.clicked.connect(self.load_full_file)
+        controls_layout.addWidget(load_full_btn)
+
         # Clear button
         clear_btn = QPushButton("Clear Logs")
         clear_btn.clicked.connect(self.clear_logs)
@@ -90,34 +216,99 @@ class LogViewerDialog(QDialog):
         self.setLayout(layout)
 
     def refresh_logs(self):
-        """Reload and display the log file content."""
-        try:
-            if os.path.exists(self.log_file_path):
-                with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Save current scroll position
-                scrollbar = self.log_text.verticalScrollBar()
-                was_at_bottom = scrollbar.value() == scrollbar.maximum()
-
-                # Update content
-                self.log_text.setPlainText(content)
+        """Schedule a background read of any new log content."""
+        if self._reading:
+            return
 
-                # If we were at the bottom, stay at the bottom
-                # (useful for auto-refresh to see new logs)
-                if was_at_bottom:
-                    scrollbar.setValue(scrollbar.maximum())
-            else:
-                self.log_text.setPlainText(f"Log file not found: {self.log_file_path}")
-        except Exception as e:
-            self.log_text.setPlainText(f"Error reading log file: {e}")
+        # One stat up front skips the whole worker round-trip when the
+        # file hasn't changed since the last read
+        try:
+            st = os.stat(self.log_file_path)
+            sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            sig = None
+        if sig is not None and sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        self._reading = True
+
+        # Replace-on-write (e.g. rotation) drops the file watch; put it
+        # back while auto-refresh is on
+        if (self.auto_refresh_checkbox.isChecked()
+                and self.log_file_path not in self.watcher.files()
+                and os.path.exists(self.log_file_path)):
+            self.watcher.addPath(self.log_file_path)
+
+        worker = LogTailWorker(
+            self.log_file_path, self._last_pos, self._tail_only,
+            self.TAIL_BYTES, self.READ_BUFFER
+        )
+        worker.signals.finished.connect(self.apply_log_delta)
+        worker.signals.error.connect(self.show_log_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def apply_log_delta(self, delta, new_pos, reset):
+        """Append the delta read by the background worker."""
+        self._reading = False
+
+        if reset:
+            self.log_text.clear()
+        self._last_pos = new_pos
+
+        if not delta:
+            return
+
+        # Save current scroll position
+        scrollbar = self.log_text.verticalScrollBar()
+        was_at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        # Append only the new content instead of rebuilding the document
+        self.log_text.appendPlainText(delta.rstrip('\n'))
+
+        # If we were at the bottom, stay at the bottom
+        # (useful for auto-refresh to see new logs)
+        if was_at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def show_log_error(self, message):
+        """Display a read failure reported by the background worker."""
+        self._reading = False
+        self.log_text.setPlainText(message)
+        self._last_pos = 0
+        self._last_sig = None
+
+    def load_full_file(self):
+        """Reload the display with the entire log file."""
+        self._tail_only = False
+        self._last_pos = 0
+        self._last_sig = None
+        self.log_text.clear()
+        self.refresh_logs()
 
     def toggle_auto_refresh(self, state):
-        """Toggle auto-refresh timer."""
+        """Toggle the file-change watch driving auto-refresh."""
         if state == Qt.Checked:
-            self.timer.start(2000)  # Refresh every 2 seconds
+            if os.path.exists(self.log_file_path):
+                self.watcher.addPath(self.log_file_path)
+            # Catch up on anything written while the watch was off
+            self.refresh_logs()
         else:
-            self.timer.stop()
+            files = self.watcher.files()
+            if files:
+                self.watcher.removePaths(files)
+
+    def on_log_file_changed(self, path):
+        """Coalesce change notification bursts into one deferred refresh."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(100, self._deferred_refresh)
+
+    def _deferred_refresh(self):
+        """Run the refresh scheduled by on_log_file_changed."""
+        self._refresh_pending = False
+        self.refresh_logs()
 
     def clear_logs(self):
         """Clear the log file."""
@@ -133,17 +324,49 @@ class LogViewerDialog(QDialog):
 
         if reply == QMessageBox.Yes:
             try:
-                # Clear the file
-                with open(self.log_file_path, 'w', encoding='utf-8') as f:
-                    f.write('')
+                self.truncate_log_file()
 
-                # Refresh display
+                # Refresh display from the top of the now-empty file
+                self._last_pos = 0
+                self.log_text.clear()
                 self.refresh_logs()
 
                 QMessageBox.information(self, 'Success', 'Log file cleared successfully')
             except Exception as e:
                 QMessageBox.critical(self, 'Error', f'Failed to clear log file: {e}')
 
+    def truncate_log_file(self):
+        """
+        Truncate the log file in place.
+
+        Goes through the logger's own RotatingFileHandler when one is
+        attached so its stream offset resets with the file - opening the
+        path separately races with the handler's open handle (and raises
+        sharing violations on Windows). Falls back to os.truncate when no
+        handler owns the file.
+        """
+        import logging
+        from logging.handlers import RotatingFileHandler
+        from logging_config import get_file_handler
+
+        candidates = list(logging.getLogger().handlers)
+        listener_handler = get_file_handler()
+        if listener_handler is not None:
+            candidates.append(listener_handler)
+
+        for handler in candidates:
+            if (isinstance(handler, RotatingFileHandler)
+                    and os.path.abspath(handler.baseFilename) == self.log_file_path):
+                handler.acquire()
+                try:
+                    handler.stream.seek(0)
+                    handler.stream.truncate()
+                finally:
+                    handler.release()
+                return
+
+        os.truncate(self.log_file_path, 0)
+
     def open_in_editor(self):
         """Open the log file in the default text editor."""
         import subprocess
@@ -151,17 +374,27 @@ class LogViewerDialog(QDialog):
 
         try:
             if sys.platform == 'win32':
+                # Already non-blocking
                 os.startfile(self.log_file_path)
-            elif sys.platform == 'darwin':
-                subprocess.run(['open', self.log_file_path])
             else:
-                subprocess.run(['xdg-open', self.log_file_path])
+                # Detach the helper instead of blocking the GUI thread on
+                # it; open/xdg-open can take a while on a cold desktop
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen(
+                    [opener, self.log_file_path],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
         except Exception as e:
             from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(self, 'Error', f'Failed to open log file: {e}')
 
     def closeEvent(self, event):
         """Handle dialog close event."""
-        # Stop timer when closing
-        self.timer.stop()
+        # Drop the file watch when closing
+        files = self.watcher.files()
+        if files:
+            self.watcher.removePaths(files)
         event.accept()
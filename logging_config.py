@@ -3,10 +3,57 @@ Logging Configuration for Video Editor
 Handles logging setup for both development and frozen executable modes.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
 import os
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import (
+    MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+)
+
+# Frozen state can't change within a process; compute it once
+_IS_FROZEN = getattr(sys, 'frozen', False)
+_LOG_FILE = 'video_editor.log' if _IS_FROZEN else 'video_editor_dev.log'
+
+# Listener thread and the handlers it owns, set by setup_logging
+_queue_listener = None
+_file_handler = None
+_mem_handler = None
+_flush_timer = None
+
+# How often buffered records are pushed to disk, so the log viewer still
+# sees INFO lines near-realtime despite the write batching
+_FLUSH_INTERVAL_SECONDS = 0.5
+
+
+def _flush_pending():
+    """Flush buffered records and re-arm the periodic flush timer."""
+    global _flush_timer
+    if _mem_handler is not None and _mem_handler.buffer:
+        _mem_handler.flush()
+    if _queue_listener is not None:
+        _flush_timer = threading.Timer(_FLUSH_INTERVAL_SECONDS, _flush_pending)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _stop_listener():
+    """Stop the queue listener and flush timer; safe to call repeatedly."""
+    global _queue_listener, _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    if _mem_handler is not None and _mem_handler.buffer:
+        _mem_handler.flush()
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging(log_level=logging.INFO):
@@ -16,19 +63,18 @@ def setup_logging(log_level=logging.INFO):
     In frozen mode (exe): Logs only to file
     In development mode: Logs to both file and console
 
+    The root logger only gets a QueueHandler; the file/console handlers
+    run on a QueueListener thread, so emitting a record from the GUI
+    thread is a queue push rather than a blocking disk write.
+
     Args:
         log_level: Logging level (default: logging.INFO)
     """
-    # Determine if running as frozen executable
-    is_frozen = getattr(sys, 'frozen', False)
-
-    # Determine log file location
-    if is_frozen:
-        # For frozen exe, put logs in user-writable location
-        log_file = 'video_editor.log'
-    else:
-        # For development, use dev log file
-        log_file = 'video_editor_dev.log'
+    global _queue_listener, _file_handler, _mem_handler
+    # Frozen exe logs to a user-writable file, development to a dev file;
+    # both resolved once at module load
+    is_frozen = _IS_FROZEN
+    log_file = _LOG_FILE
 
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -48,7 +94,18 @@ def setup_logging(log_level=logging.INFO):
     )
     file_handler.setFormatter(detailed_formatter)
     file_handler.setLevel(log_level)
-    handlers.append(file_handler)
+
+    # Buffer file writes: records reach disk in batches of up to 256, on
+    # any ERROR, or via the periodic flush, instead of one write+flush
+    # per record
+    mem_handler = MemoryHandler(
+        capacity=256,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    mem_handler.setLevel(log_level)
+    handlers.append(mem_handler)
 
     # Console handler (only in development mode)
     if not is_frozen and sys.stdout is not None:
@@ -57,12 +114,30 @@ def setup_logging(log_level=logging.INFO):
         console_handler.setLevel(log_level)
         handlers.append(console_handler)
 
-    # Configure root logger
+    # Restarting (e.g. setup_logging called twice) replaces the listener
+    _stop_listener()
+
+    # Configure root logger: records go to a queue, and the listener
+    # thread fans them out to the real handlers
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
     logging.basicConfig(
         level=log_level,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True  # Override any existing configuration
     )
+    # basicConfig stamps its default formatter onto the queue handler,
+    # which would bake a first format pass into every record before the
+    # listener's handlers format it again; undo that
+    queue_handler.setFormatter(None)
+
+    _file_handler = file_handler
+    _mem_handler = mem_handler
+    _queue_listener = QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    _flush_pending()
 
     # Set up exception hook to log uncaught exceptions
     def handle_exception(exc_type, exc_value, exc_traceback):
@@ -90,16 +165,28 @@ def setup_logging(log_level=logging.INFO):
     logger.info("=" * 70)
 
 
+@functools.lru_cache(maxsize=1)
 def get_log_file_path():
     """
     Get the path to the current log file.
 
+    The abspath resolution is cached; the answer never changes within
+    a process.
+
     Returns:
         Absolute path to the log file
     """
-    is_frozen = getattr(sys, 'frozen', False)
-    log_file = 'video_editor.log' if is_frozen else 'video_editor_dev.log'
-    return os.path.abspath(log_file)
+    return os.path.abspath(_LOG_FILE)
+
+
+def get_file_handler():
+    """
+    Get the RotatingFileHandler owned by the queue listener.
+
+    Returns:
+        The file handler, or None if setup_logging hasn't run
+    """
+    return _file_handler
 
 
 def set_module_log_level(module_name, level):
@@ -17,14 +17,32 @@ setup_logging()
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Neither of these can change within a process; compute them once
+_SYSTEM = platform.system()
+_IS_FROZEN = getattr(sys, 'frozen', False)
+
+
+# True once setup_media_libs has run; the probing and environment edits
+# only need to happen once per process
+_media_libs_initialized = False
+
 
 # Set up ffplay and VLC paths BEFORE any other imports
 # This must be done early, as these libraries read paths on import
 def setup_media_libs():
-    """Configure bundled media libraries before they are loaded."""
+    """Configure bundled media libraries before they are loaded.
+
+    Idempotent: repeated calls (e.g. from an alternate entry point)
+    skip the filesystem probing and environment mutation.
+    """
+    global _media_libs_initialized
+    if _media_libs_initialized:
+        return
+    _media_libs_initialized = True
+
     logger.info("Setting up bundled media libraries")
 
-    system = platform.system()
+    system = _SYSTEM
     if system == "Windows":
         platform_dir = "win32"
         exe_name = "ffplay.exe"
@@ -39,25 +57,33 @@ def setup_media_libs():
         return
 
     # Get the application directory
-    if getattr(sys, 'frozen', False):
+    if _IS_FROZEN:
         app_dir = sys._MEIPASS
         logger.info(f"Running as frozen executable, app_dir: {app_dir}")
     else:
         app_dir = os.path.dirname(os.path.abspath(__file__))
         logger.info(f"Running as script, app_dir: {app_dir}")
 
+    # One directory read replaces a stat per probed binary; each stat can
+    # cost several ms on network drives or under antivirus scanners
+    bin_dir = os.path.join(app_dir, "bin", platform_dir)
+    try:
+        bin_entries = {entry.name: entry for entry in os.scandir(bin_dir)}
+    except OSError:
+        bin_entries = {}
+
     # Set paths for both ffplay and ffmpeg
-    ffplay_path = os.path.join(app_dir, "bin", platform_dir, exe_name)
+    ffplay_path = os.path.join(bin_dir, exe_name)
     ffmpeg_name = "ffmpeg.exe" if system == "Windows" else "ffmpeg"
-    ffmpeg_path = os.path.join(app_dir, "bin", platform_dir, ffmpeg_name)
+    ffmpeg_path = os.path.join(bin_dir, ffmpeg_name)
 
-    if os.path.exists(ffplay_path):
+    if exe_name in bin_entries:
         os.environ["FFPLAY_BINARY"] = ffplay_path
         logger.info(f"Set FFPLAY_BINARY to {ffplay_path}")
     else:
         logger.warning(f"Bundled ffplay not found at {ffplay_path}, will use system ffplay")
 
-    if os.path.exists(ffmpeg_path):
+    if ffmpeg_name in bin_entries:
         os.environ["FFMPEG_BINARY"] = ffmpeg_path
         logger.info(f"Set FFMPEG_BINARY to {ffmpeg_path}")
     else:
@@ -65,11 +91,15 @@ def setup_media_libs():
 
     # Set up VLC path (Windows/macOS only, Linux uses system VLC)
     if system in ["Windows", "Darwin"]:
-        vlc_dir = os.path.join(app_dir, "bin", platform_dir, "vlc")
-        if os.path.exists(vlc_dir):
-            # Add VLC directory to PATH so python-vlc can find the DLLs
-            if vlc_dir not in os.environ.get('PATH', ''):
-                os.environ['PATH'] = vlc_dir + os.pathsep + os.environ.get('PATH', '')
+        vlc_dir = os.path.join(bin_dir, "vlc")
+        if "vlc" in bin_entries and bin_entries["vlc"].is_dir():
+            # Add VLC directory to PATH so python-vlc can find the DLLs.
+            # Compare whole components, not substrings: a substring test
+            # misses nothing but can false-positive on a longer entry
+            # that merely contains vlc_dir, skipping the prepend
+            current_path = os.environ.get('PATH', '')
+            if vlc_dir not in current_path.split(os.pathsep):
+                os.environ['PATH'] = vlc_dir + os.pathsep + current_path
                 logger.info(f"Added {vlc_dir} to PATH")
 
             # On Windows Python 3.8+, use add_dll_directory for better DLL loading
@@ -6,7 +6,6 @@ Handles all GUI dialogs and interactions for clip persistence.
 import os
 from enum import Enum
 from datetime import datetime
-from PyQt5.QtWidgets import QMessageBox, QFileDialog
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +18,27 @@ class RecoveryAction(Enum):
     CANCEL = "cancel"
 
 
+# Display format for recovery timestamps
+_TIMESTAMP_DISPLAY_FMT = "%Y-%m-%d %H:%M:%S"
+
+# QMessageBox reply -> RecoveryAction table, built on first use so the
+# module keeps importing without QtWidgets
+_REPLY_TO_ACTION = None
+
+
+def _reply_to_action(reply):
+    """Map a QMessageBox reply to the matching RecoveryAction."""
+    global _REPLY_TO_ACTION
+    if _REPLY_TO_ACTION is None:
+        from PyQt5.QtWidgets import QMessageBox
+        _REPLY_TO_ACTION = {
+            QMessageBox.Yes: RecoveryAction.LOAD,
+            QMessageBox.No: RecoveryAction.DISCARD,
+            QMessageBox.Cancel: RecoveryAction.CANCEL,
+        }
+    return _REPLY_TO_ACTION.get(reply, RecoveryAction.CANCEL)
+
+
 class PersistenceUI:
     """
     Manages all persistence-related UI interactions.
@@ -48,12 +68,14 @@ class PersistenceUI:
             RecoveryAction indicating user's choice
         """
         try:
+            from PyQt5.QtWidgets import QMessageBox
+
             timestamp_str = recovery_data.get('timestamp', 'unknown time')
             try:
                 # Parse ISO format timestamp
                 timestamp = datetime.fromisoformat(timestamp_str)
-                timestamp_display = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            except:
+                timestamp_display = timestamp.strftime(_TIMESTAMP_DISPLAY_FMT)
+            except (ValueError, TypeError):
                 timestamp_display = timestamp_str
 
             clip_count = len(recovery_data.get('clips', []))
@@ -75,12 +97,7 @@ class PersistenceUI:
                 QMessageBox.Yes
             )
 
-            if reply == QMessageBox.Yes:
-                return RecoveryAction.LOAD
-            elif reply == QMessageBox.No:
-                return RecoveryAction.DISCARD
-            else:
-                return RecoveryAction.CANCEL
+            return _reply_to_action(reply)
 
         except Exception as e:
             logger.error(f"Error showing recovery dialog: {e}", exc_info=True)
@@ -98,6 +115,8 @@ class PersistenceUI:
             True to load clips anyway, False to skip
         """
         try:
+            from PyQt5.QtWidgets import QMessageBox
+
             recovery_name = os.path.basename(recovery_video)
             current_name = os.path.basename(current_video)
 
@@ -133,6 +152,8 @@ class PersistenceUI:
             True to load clips anyway, False to skip recovery
         """
         try:
+            from PyQt5.QtWidgets import QMessageBox
+
             message = (
                 f"The video file referenced in the saved clips was not found:\n\n"
                 f"{video_path}\n\n"
@@ -165,6 +186,8 @@ class PersistenceUI:
             Selected file path or empty string if cancelled
         """
         try:
+            from PyQt5.QtWidgets import QFileDialog
+
             default_path = os.path.join(default_dir, default_name)
 
             file_path, _ = QFileDialog.getSaveFileName(
@@ -192,6 +215,8 @@ class PersistenceUI:
             Selected file path or empty string if cancelled
         """
         try:
+            from PyQt5.QtWidgets import QFileDialog
+
             file_path, _ = QFileDialog.getOpenFileName(
                 self.parent,
                 "Load Clips",
@@ -213,6 +238,8 @@ class PersistenceUI:
             file_path: Path where clips were saved
         """
         try:
+            from PyQt5.QtWidgets import QMessageBox
+
             file_name = os.path.basename(file_path)
             QMessageBox.information(
                 self.parent,
@@ -230,6 +257,8 @@ class PersistenceUI:
             error_message: The error message to display
         """
         try:
+            from PyQt5.QtWidgets import QMessageBox
+
             QMessageBox.critical(
                 self.parent,
                 "Load Error",
@@ -246,6 +275,8 @@ class PersistenceUI:
             error_message: The error message to display
         """
         try:
+            from PyQt5.QtWidgets import QMessageBox
+
             QMessageBox.critical(
                 self.parent,
                 "Save Error",
@@ -8,9 +8,117 @@ Run this before building to catch common issues that appear in frozen executable
 import sys
 import os
 import ast
+import bisect
+import json
+import mmap
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# One alternation covers all three streams in a single pass over the
+# content, compiled once at import. A bytes pattern so it can scan an
+# mmap'd view directly. The old per-stream patterns carried a
+# (?!.*is not None) lookahead that scanned to end-of-line for every hit
+# and missed guards anyway; the line-level check below is authoritative.
+_STREAM_RE = re.compile(rb'sys\.(stdout|stderr|stdin)')
+
+
+def _line_starts(content):
+    """Byte offsets of each line start in content.
+
+    Built with a C-level find loop; works on bytes and mmap'd views
+    alike.
+    """
+    starts = [0]
+    pos = content.find(b'\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = content.find(b'\n', pos + 1)
+    return starts
+
+# Subtrees rooted at these node types can never contain a call
+# expression; the traversal prunes them instead of walking their
+# children like ast.walk does
+_CALL_FREE_TYPES = (
+    ast.Constant, ast.Name, ast.Import, ast.ImportFrom,
+    ast.Global, ast.Nonlocal, ast.Pass, ast.Break, ast.Continue,
+)
+
+
+def _iter_calls(tree):
+    """Yield every ast.Call node reachable from tree.
+
+    Replaces filtering ast.walk: call-free subtrees (constants, names,
+    imports - the bulk of most modules) are skipped at the boundary
+    rather than yielded and type-checked one node at a time.
+    """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if type(node) is ast.Call:
+            yield node
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, _CALL_FREE_TYPES):
+                stack.append(child)
+
+
+# Directory names never descended into: test code, virtualenvs, and
+# build output don't ship in the frozen executable
+_SKIP_DIRS = frozenset({
+    'tests', 'venv', '.venv', '__pycache__', 'build', 'dist',
+    '.git', 'node_modules', '.mypy_cache', '.pytest_cache',
+})
+
+
+def _format_warning(warning):
+    """Render a structured warning record for display.
+
+    Warnings are collected as plain tuples (kind, filepath, lineno,
+    ...) and only formatted here: the check loop allocates no message
+    strings, and tuples pickle far smaller for the process-pool and
+    cache paths. Records read back from the JSON cache arrive as lists,
+    which index the same way.
+    """
+    kind = warning[0]
+    if kind == 'print':
+        _, filepath, lineno = warning
+        return (
+            f"{filepath}:{lineno}: "
+            f"print() statement found - may fail in frozen GUI app. "
+            f"Consider using logging instead."
+        )
+    if kind == 'subprocess':
+        _, filepath, lineno, attr = warning
+        return (
+            f"{filepath}:{lineno}: "
+            f"subprocess.{attr} without explicit stdout/stderr. "
+            f"May fail in frozen app. Add stdout=subprocess.PIPE, stderr=subprocess.PIPE"
+        )
+    _, filepath, lineno, stream_name = warning
+    return (
+        f"{filepath}:{lineno}: "
+        f"Direct sys.{stream_name} access - may be None in frozen app. "
+        f"Check for None first or use logging."
+    )
+
+
+def _iter_python_files(root):
+    """Yield DirEntry objects for Python files under root.
+
+    Prunes skipped directories at the boundary (os.walk still descended
+    into them and filtered afterwards with a substring test per ancestor
+    component), and yields DirEntry so callers get the stat result the
+    directory listing already fetched.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in _SKIP_DIRS:
+                    continue
+                yield from _iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry
+
 
 class PreBuildChecker:
     """Check code for common frozen executable issues."""
@@ -22,103 +130,227 @@ class PreBuildChecker:
 
     def check_file(self, filepath):
         """Check a single Python file for issues."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
+        # Large files are mapped instead of read so the substring and
+        # regex scans run against the page cache without copying the
+        # whole file into a Python object first
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > self.MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self._check_content(filepath, mm)
+            else:
+                self._check_content(filepath, f.read())
+
+    def _check_content(self, filepath, content):
+        """Run all checks against file content (bytes or an mmap view)."""
         self.checked_files += 1
-        self.check_print_statements(filepath, content)
-        self.check_stdout_usage(filepath, content)
-        self.check_subprocess_calls(filepath, content)
 
-    def check_print_statements(self, filepath, content):
-        """Check for print statements that might fail when stdout is None."""
-        # Parse the file
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
+        # Cheap substring probes before the expensive work: a C-level
+        # search is orders of magnitude faster per byte than ast.parse,
+        # and most files contain none of the triggers
+        has_calls = (content.find(b'print') != -1
+                     or content.find(b'subprocess') != -1)
+        has_streams = content.find(b'sys.std') != -1
+        if not has_calls and not has_streams:
             return
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == 'print':
-                    # Found a print statement
-                    self.warnings.append(
-                        f"{filepath}:{node.lineno}: "
-                        f"print() statement found - may fail in frozen GUI app. "
-                        f"Consider using logging instead."
-                    )
-
-    def check_stdout_usage(self, filepath, content):
+        line_starts = None
+        if has_calls:
+            # Parse once; the call checks share the tree instead of each
+            # re-parsing the same content. ast.parse takes the source as
+            # bytes and honours coding declarations itself.
+            try:
+                tree = ast.parse(bytes(content))
+            except SyntaxError:
+                tree = None
+            if tree is not None:
+                candidate_lines = None
+                if len(content) > self.LARGE_FILE_BYTES:
+                    line_starts = _line_starts(content)
+                    candidate_lines = self._candidate_lines(content, line_starts)
+                self.check_calls(filepath, tree, candidate_lines)
+        if has_streams:
+            if line_starts is None:
+                line_starts = _line_starts(content)
+            self.check_stdout_usage(filepath, content, line_starts)
+
+    # Above this size a file is mmap'd rather than read whole
+    MMAP_MIN_BYTES = 64 * 1024
+
+    # Above this size, call checking narrows to the lines where a
+    # trigger substring actually occurs
+    LARGE_FILE_BYTES = 100 * 1024
+
+    def _candidate_lines(self, content, line_starts):
+        """Line numbers where a call-check trigger substring occurs.
+
+        A flagged call always carries its trigger text ('print' or
+        'subprocess') at the call site, so in very large files the call
+        check can skip every node whose line has no trigger hit. The
+        one-line window either side covers calls whose expression starts
+        just before the trigger text.
+        """
+        candidates = set()
+        for trigger in (b'print', b'subprocess'):
+            pos = content.find(trigger)
+            while pos != -1:
+                line = bisect.bisect_right(line_starts, pos)
+                candidates.update((line - 1, line, line + 1))
+                pos = content.find(trigger, pos + len(trigger))
+        return candidates
+
+    def check_calls(self, filepath, tree, candidate_lines=None):
+        """Check call sites for print() and bare subprocess invocations.
+
+        One walk over the tree covers both checks; dispatch on the type
+        of the call's func node replaces the isinstance chain. When
+        candidate_lines is given (large files), calls on other lines are
+        skipped without inspection.
+        """
+        dispatch = {
+            ast.Name: self._check_print_call,
+            ast.Attribute: self._check_subprocess_call,
+        }
+        for node in _iter_calls(tree):
+            if candidate_lines is not None and node.lineno not in candidate_lines:
+                continue
+            handler = dispatch.get(type(node.func))
+            if handler is not None:
+                handler(filepath, node)
+
+    def _check_print_call(self, filepath, node):
+        """Warn about a call through a bare name if it is print()."""
+        if node.func.id == 'print':
+            # Found a print statement
+            self.warnings.append(('print', filepath, node.lineno))
+
+    def _check_subprocess_call(self, filepath, node):
+        """Warn about subprocess calls without explicit stdout/stderr."""
+        # Check if it's subprocess.run, subprocess.Popen, etc.
+        if (isinstance(node.func.value, ast.Name) and
+            node.func.value.id == 'subprocess' and
+            node.func.attr in ['run', 'Popen', 'call', 'check_call']):
+
+            # Check if stdout/stderr are specified
+            has_stdout = False
+            has_stderr = False
+
+            for keyword in node.keywords:
+                if keyword.arg == 'stdout':
+                    has_stdout = True
+                if keyword.arg == 'stderr':
+                    has_stderr = True
+
+            if not (has_stdout and has_stderr):
+                self.warnings.append(
+                    ('subprocess', filepath, node.lineno, node.func.attr)
+                )
+
+    def check_stdout_usage(self, filepath, content, line_starts):
         """Check for direct stdout/stderr access."""
-        patterns = [
-            (r'sys\.stdout(?!.*is not None)', 'stdout'),
-            (r'sys\.stderr(?!.*is not None)', 'stderr'),
-            (r'sys\.stdin(?!.*is not None)', 'stdin'),
-        ]
-
-        for pattern, stream_name in patterns:
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                line_num = content[:match.start()].count('\n') + 1
-                # Check if it's a None check (which is good)
-                line = content.split('\n')[line_num - 1]
-                if 'is not None' not in line and 'is None' not in line:
-                    self.warnings.append(
-                        f"{filepath}:{line_num}: "
-                        f"Direct sys.{stream_name} access - may be None in frozen app. "
-                        f"Check for None first or use logging."
-                    )
-
-    def check_subprocess_calls(self, filepath, content):
-        """Check for subprocess calls without explicit stdout/stderr."""
+        # A match position maps to a line number with one bisect over
+        # the line-start table; only matched lines are sliced out of the
+        # content instead of splitting the whole file
+        n_lines = len(line_starts)
+        for match in _STREAM_RE.finditer(content):
+            stream_name = match.group(1).decode('ascii')
+            line_num = bisect.bisect_right(line_starts, match.start())
+            start = line_starts[line_num - 1]
+            end = line_starts[line_num] - 1 if line_num < n_lines else len(content)
+            # Check if it's a None check (which is good)
+            line = content[start:end]
+            if b'is not None' not in line and b'is None' not in line:
+                self.warnings.append(('stream', filepath, line_num, stream_name))
+
+    # Below this many files the fork/spawn and IPC cost of a process
+    # pool outweighs the parallel parsing win; check serially instead
+    MIN_FILES_FOR_POOL = 32
+
+    # Per-file results from the previous run, keyed by path and
+    # validated by (mtime_ns, size); re-runs during a build-debug cycle
+    # only re-parse files that actually changed. The version stamp
+    # invalidates caches written with an older record layout.
+    CACHE_FILE = '.prebuild_cache.json'
+    CACHE_VERSION = 2
+
+    def _load_cache(self, root_dir):
+        """Load the per-file result cache from a previous run."""
         try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                # Check if it's subprocess.run, subprocess.Popen, etc.
-                if isinstance(node.func, ast.Attribute):
-                    if (isinstance(node.func.value, ast.Name) and
-                        node.func.value.id == 'subprocess' and
-                        node.func.attr in ['run', 'Popen', 'call', 'check_call']):
-
-                        # Check if stdout/stderr are specified
-                        has_stdout = False
-                        has_stderr = False
-
-                        for keyword in node.keywords:
-                            if keyword.arg == 'stdout':
-                                has_stdout = True
-                            if keyword.arg == 'stderr':
-                                has_stderr = True
-
-                        if not (has_stdout and has_stderr):
-                            self.warnings.append(
-                                f"{filepath}:{node.lineno}: "
-                                f"subprocess.{node.func.attr} without explicit stdout/stderr. "
-                                f"May fail in frozen app. Add stdout=subprocess.PIPE, stderr=subprocess.PIPE"
-                            )
+            with open(os.path.join(root_dir, self.CACHE_FILE),
+                      'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get('version') != self.CACHE_VERSION:
+            return {}
+        return cache.get('files', {})
+
+    def _save_cache(self, root_dir, files):
+        """Write the per-file result cache for the next run."""
+        try:
+            with open(os.path.join(root_dir, self.CACHE_FILE),
+                      'w', encoding='utf-8') as f:
+                json.dump({'version': self.CACHE_VERSION, 'files': files}, f)
+        except OSError:
+            pass  # Read-only tree; the cache is only an accelerator
 
     def check_project(self, root_dir='.'):
         """Check all Python files in the project."""
         print("[*] Checking for frozen executable compatibility issues...\n")
 
-        # Find all Python files
-        python_files = []
-        for root, dirs, files in os.walk(root_dir):
-            # Skip test directories and virtual environments
-            if any(skip in root for skip in ['tests', 'venv', '.venv', '__pycache__', 'build', 'dist']):
+        # Find all Python files, skipping pruned directories entirely
+        python_files = list(_iter_python_files(root_dir))
+
+        # Serve unchanged files from the cache; only changed or new
+        # files go through read + parse. DirEntry.stat() reuses the
+        # metadata the directory listing already fetched where the
+        # platform provides it.
+        cache = self._load_cache(root_dir)
+        new_cache = {}
+        to_check = []
+        for dir_entry in python_files:
+            filepath = dir_entry.path
+            try:
+                st = dir_entry.stat()
+            except OSError:
                 continue
-
-            for file in files:
-                if file.endswith('.py'):
-                    python_files.append(os.path.join(root, file))
-
-        # Check each file
-        for filepath in python_files:
-            self.check_file(filepath)
+            entry = cache.get(filepath)
+            if (entry is not None
+                    and entry['mtime'] == st.st_mtime_ns
+                    and entry['size'] == st.st_size):
+                self.warnings.extend(entry['warnings'])
+                self.issues.extend(entry['issues'])
+                self.checked_files += 1
+                new_cache[filepath] = entry
+            else:
+                to_check.append((filepath, st))
+
+        # Check each remaining file. Files are independent (read + parse
+        # + walk), so large trees fan out across cores; parsing is the
+        # dominant cost and each worker process parses its own chunk.
+        cpu_count = os.cpu_count() or 1
+        if len(to_check) >= self.MIN_FILES_FOR_POOL and cpu_count > 1:
+            chunksize = max(1, len(to_check) // (cpu_count * 4))
+            with ProcessPoolExecutor(max_workers=cpu_count) as executor:
+                results = list(executor.map(
+                    _check_file_worker, [fp for fp, _ in to_check],
+                    chunksize=chunksize
+                ))
+        else:
+            results = map(_check_file_worker, [fp for fp, _ in to_check])
+
+        for (filepath, st), (warnings, issues) in zip(to_check, results):
+            self.warnings.extend(warnings)
+            self.issues.extend(issues)
+            self.checked_files += 1
+            new_cache[filepath] = {
+                'mtime': st.st_mtime_ns,
+                'size': st.st_size,
+                'warnings': warnings,
+                'issues': issues,
+            }
+
+        self._save_cache(root_dir, new_cache)
 
         # Print results
         print(f"[+] Checked {self.checked_files} Python files\n")
@@ -132,7 +364,7 @@ class PreBuildChecker:
         if self.warnings:
             print("[!] WARNINGS (review before building):")
             for warning in self.warnings:
-                print(f"  - {warning}")
+                print(f"  - {_format_warning(warning)}")
             print()
 
         if not self.issues and not self.warnings:
@@ -145,20 +377,33 @@ class PreBuildChecker:
         print("[*] Running frozen compatibility tests...\n")
 
         import subprocess
+        # Inherit this console's streams (explicit None) so pytest
+        # writes output live instead of this process buffering and
+        # decoding the whole -v log just to re-print it
         result = subprocess.run(
             [sys.executable, '-m', 'pytest', 'tests/test_frozen_compatibility.py', '-v'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stdout=None,
+            stderr=None,
+            check=False
         )
 
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-
         return result.returncode == 0
 
 
+def _check_file_worker(filepath):
+    """Check one file in a pool worker process.
+
+    Module-level (picklable) and pure: results come back as lists for
+    the parent to aggregate instead of mutating shared state.
+
+    Returns:
+        Tuple of (warnings, issues) found in the file
+    """
+    checker = PreBuildChecker()
+    checker.check_file(filepath)
+    return checker.warnings, checker.issues
+
+
 def main():
     """Run all pre-build checks."""
     print("=" * 70)
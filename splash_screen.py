@@ -3,10 +3,12 @@ Splash Screen
 Displays a loading screen during application startup.
 """
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (
+    QApplication, QDesktopWidget, QLabel, QProgressBar, QVBoxLayout, QWidget
+)
+from PyQt5.QtCore import Qt, QEventLoop
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +16,13 @@ logger = logging.getLogger(__name__)
 class SplashScreen(QWidget):
     """Custom splash screen with progress bar."""
 
+    # Minimum interval between event-loop pumps; screens repaint at
+    # ~30 fps anyway, so draining the loop more often is wasted work
+    PUMP_INTERVAL = 0.033
+
     def __init__(self):
         super().__init__()
+        self._last_pump = 0.0
         self.init_ui()
 
     def init_ui(self):
@@ -33,6 +40,13 @@ class SplashScreen(QWidget):
             QLabel {
                 color: #ffffff;
             }
+            QLabel#titleLabel {
+                font-size: 18pt;
+                font-weight: bold;
+            }
+            QLabel#statusLabel {
+                font-size: 9pt;
+            }
             QProgressBar {
                 border: 2px solid #555555;
                 border-radius: 5px;
@@ -51,12 +65,10 @@ class SplashScreen(QWidget):
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(15)
 
-        # Title
+        # Title; font comes from the stylesheet, so no QtGui QFont
+        # objects are built on the startup path
         title_label = QLabel("Video Editor")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setObjectName("titleLabel")
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
 
@@ -73,10 +85,8 @@ class SplashScreen(QWidget):
 
         # Status message
         self.status_label = QLabel("Initializing...")
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
-        status_font = QFont()
-        status_font.setPointSize(9)
-        self.status_label.setFont(status_font)
         layout.addWidget(self.status_label)
 
         layout.addStretch()
@@ -88,7 +98,6 @@ class SplashScreen(QWidget):
 
     def center_on_screen(self):
         """Center the splash screen on the display."""
-        from PyQt5.QtWidgets import QDesktopWidget
         screen_geometry = QDesktopWidget().availableGeometry()
         x = (screen_geometry.width() - self.width()) // 2
         y = (screen_geometry.height() - self.height()) // 2
@@ -107,6 +116,14 @@ class SplashScreen(QWidget):
             self.status_label.setText(message)
             logger.debug(f"Splash screen: {value}% - {message}")
 
-        # Process events to update UI
-        from PyQt5.QtWidgets import QApplication
-        QApplication.processEvents()
+        # Pump the event loop so the update paints, but at most every
+        # PUMP_INTERVAL: rapid back-to-back set_progress calls during
+        # startup would otherwise drain the full loop per call. Input
+        # and socket events stay queued - the splash only needs paints.
+        now = time.monotonic()
+        if value >= 100 or now - self._last_pump > self.PUMP_INTERVAL:
+            QApplication.processEvents(
+                QEventLoop.ExcludeUserInputEvents
+                | QEventLoop.ExcludeSocketNotifiers
+            )
+            self._last_pump = now
@@ -106,15 +106,15 @@ class TestFrozenCompatibility(unittest.TestCase):
         """Test that VLC player can initialize in frozen environment."""
         # Create a mock temp directory for _MEIPASS
         import tempfile
+        from pathlib import Path
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Create mock bin structure
-            bin_dir = os.path.join(temp_dir, 'bin', 'win32', 'vlc')
-            os.makedirs(bin_dir, exist_ok=True)
-
-            # Create mock DLL files
-            open(os.path.join(bin_dir, 'libvlc.dll'), 'a').close()
-            open(os.path.join(bin_dir, 'libvlccore.dll'), 'a').close()
-            os.makedirs(os.path.join(bin_dir, 'plugins'), exist_ok=True)
+            # Create mock bin structure with mock DLL files; touch() is
+            # one create syscall per file vs open-for-append + close
+            bin_dir = Path(temp_dir, 'bin', 'win32', 'vlc')
+            bin_dir.mkdir(parents=True, exist_ok=True)
+            (bin_dir / 'libvlc.dll').touch()
+            (bin_dir / 'libvlccore.dll').touch()
+            (bin_dir / 'plugins').mkdir(exist_ok=True)
 
             self.simulate_frozen_environment(temp_dir)
 
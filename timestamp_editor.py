@@ -8,6 +8,19 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QKeyEvent
 import re
 
+# Compiled once at import: parse_timestamp_components runs on every
+# arrow-key press, and a precompiled pattern skips re's per-call cache
+# lookup
+_TIMESTAMP_RE = re.compile(r'^(?:(\d+):)?(?:(\d+):)?(\d+(?:\.\d+)?)$')
+
+
+def _normalize_ms(total_ms):
+    """Split a non-negative millisecond total into (hh, mm, ss, ms)."""
+    hours, rem = divmod(total_ms, 3600000)
+    minutes, rem = divmod(rem, 60000)
+    seconds, milliseconds = divmod(rem, 1000)
+    return hours, minutes, seconds, milliseconds
+
 
 class TimestampEditor(QLineEdit):
     """
@@ -56,70 +69,20 @@ class TimestampEditor(QLineEdit):
         delta = 1 if increment else -1
 
         if cursor_pos <= 2:
-            # Adjust hours
-            hours = max(0, hours + delta)
+            step_ms = 3600000  # Hours
         elif cursor_pos <= 5:
-            # Adjust minutes
-            minutes += delta
-            if minutes >= 60:
-                minutes = 0
-                hours += 1
-            elif minutes < 0:
-                minutes = 59
-                hours = max(0, hours - 1)
+            step_ms = 60000  # Minutes
         elif cursor_pos <= 8:
-            # Adjust seconds
-            seconds += delta
-            if seconds >= 60:
-                seconds = 0
-                minutes += 1
-                if minutes >= 60:
-                    minutes = 0
-                    hours += 1
-            elif seconds < 0:
-                if minutes > 0 or hours > 0:
-                    seconds = 59
-                    minutes -= 1
-                    if minutes < 0:
-                        if hours > 0:
-                            minutes = 59
-                            hours -= 1
-                        else:
-                            minutes = 0
-                            seconds = 0
-                else:
-                    seconds = 0
+            step_ms = 1000  # Seconds
         else:
-            # Adjust milliseconds (in steps of 100ms for easier control)
-            milliseconds += delta * 100
-            if milliseconds >= 1000:
-                milliseconds = 0
-                seconds += 1
-                if seconds >= 60:
-                    seconds = 0
-                    minutes += 1
-                    if minutes >= 60:
-                        minutes = 0
-                        hours += 1
-            elif milliseconds < 0:
-                if seconds > 0 or minutes > 0 or hours > 0:
-                    milliseconds = 900
-                    seconds -= 1
-                    if seconds < 0:
-                        if minutes > 0 or hours > 0:
-                            seconds = 59
-                            minutes -= 1
-                            if minutes < 0:
-                                if hours > 0:
-                                    minutes = 59
-                                    hours -= 1
-                                else:
-                                    minutes = 0
-                                    seconds = 0
-                        else:
-                            seconds = 0
-                else:
-                    milliseconds = 0
+            step_ms = 100  # Milliseconds (steps of 100ms for easier control)
+
+        # Do the carry/borrow on one total instead of cascading through
+        # the components; the clamp keeps the timestamp at or above zero
+        total_ms = hours * 3600000 + minutes * 60000 + seconds * 1000 + milliseconds
+        hours, minutes, seconds, milliseconds = _normalize_ms(
+            max(0, total_ms + delta * step_ms)
+        )
 
         # Format back to timestamp
         new_timestamp = f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
@@ -145,8 +108,7 @@ class TimestampEditor(QLineEdit):
         timestamp = timestamp.strip()
 
         # Match timestamp pattern
-        pattern = r'^(?:(\d+):)?(?:(\d+):)?(\d+(?:\.\d+)?)$'
-        match = re.match(pattern, timestamp)
+        match = _TIMESTAMP_RE.match(timestamp)
 
         if not match:
             return (None, None, None)
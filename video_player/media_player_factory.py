@@ -10,6 +10,11 @@ import logging
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Probe result cached after the first get_available_players call. The
+# probe is deferred (not run at import) so the vlc import only happens
+# once the bundled library paths have been set up.
+_available_players = None
+
 
 class MediaPlayerFactory:
     """
@@ -50,13 +55,19 @@ class MediaPlayerFactory:
         Returns:
             List of available player implementation names
         """
-        available = []
+        global _available_players
 
-        # Check VLC
-        try:
-            import vlc
-            available.append("VLC Player")
-        except ImportError:
-            pass
+        if _available_players is None:
+            available = []
+
+            # Check VLC
+            try:
+                import vlc
+                available.append("VLC Player")
+            except ImportError:
+                pass
+
+            _available_players = available
 
-        return available
+        # Copy so callers can't mutate the cached list
+        return list(_available_players)
@@ -14,6 +14,25 @@ class MediaPlayerMeta(wrappertype, ABCMeta):
     pass
 
 
+# Memo for _fmt_ts: during playback the HH:MM:SS prefix changes once a
+# second while the formatter runs many times a second, so the prefix
+# from the last-seen second is reused and only the .mmm part is rebuilt
+_last_sec = -1
+_last_prefix = ""
+
+
+def _fmt_ts(milliseconds: int) -> str:
+    """Format integer milliseconds as HH:MM:SS.mmm with a memoized prefix."""
+    global _last_sec, _last_prefix
+    sec, ms = divmod(int(milliseconds), 1000)
+    if sec != _last_sec:
+        hours, rem = divmod(sec, 3600)
+        minutes, secs = divmod(rem, 60)
+        _last_prefix = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        _last_sec = sec
+    return f"{_last_prefix}.{ms:03d}"
+
+
 class MediaPlayerInterface(QWidget, metaclass=MediaPlayerMeta):
     """
     Abstract base class for media player implementations.
@@ -90,13 +109,9 @@ class MediaPlayerInterface(QWidget, metaclass=MediaPlayerMeta):
         Returns:
             Timestamp string in format "HH:MM:SS.mmm"
         """
-        seconds = milliseconds / 1000.0
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        ms = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:03d}"
+        # The divmod work for the HH:MM:SS half is memoized per second
+        # in _fmt_ts; this runs on every playback update
+        return _fmt_ts(milliseconds)
 
     @staticmethod
     def timestamp_to_milliseconds(timestamp: str) -> int:
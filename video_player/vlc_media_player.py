@@ -6,8 +6,9 @@ Uses VLC for video playback with full audio support.
 from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider, QStyle, QComboBox, QFrame, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QSignalBlocker, pyqtSignal
 from .media_player_interface import MediaPlayerInterface
+import functools
 import sys
 import os
 import logging
@@ -15,6 +16,74 @@ import logging
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Cookie from os.add_dll_directory; held for the process lifetime so
+# the bundled-VLC directory stays registered with the OS loader
+_dll_cookie = None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_vlc():
+    """
+    Locate bundled VLC, set up the environment, and import python-vlc.
+
+    Path discovery, environment mutation, and DLL preloading only need
+    to happen once per process; the cache means a second player widget
+    gets the already-imported module back without replaying any
+    filesystem checks.
+
+    Returns:
+        The imported vlc module (raises ImportError if unavailable)
+    """
+    # Set up bundled VLC path (Windows only, Linux uses system VLC)
+    if getattr(sys, 'frozen', False):
+        # Running as compiled executable
+        app_dir = sys._MEIPASS
+    else:
+        # Running as script - go up one level from video_player/ directory
+        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    if sys.platform.startswith('win'):
+        platform_dir = "win32"
+        lib_name = "libvlc.dll"
+    elif sys.platform == 'darwin':
+        platform_dir = "darwin"
+        lib_name = "libvlc.dylib"
+    else:
+        # Linux - use system VLC
+        platform_dir = None
+        lib_name = None
+
+    # Try bundled VLC first (Windows/macOS)
+    if platform_dir:
+        vlc_path = os.path.join(app_dir, "bin", platform_dir, "vlc")
+        vlc_lib_path = os.path.join(vlc_path, lib_name)
+
+        if os.path.exists(vlc_lib_path):
+            logger.info(f"Using bundled VLC from {vlc_path}")
+
+            # Register the directory with the OS loader rather than
+            # hand-preloading the DLLs: the old ctypes.CDLL calls
+            # parsed the PE headers and resolved imports purely to
+            # influence search order, work the loader repeats anyway
+            # when python-vlc loads the same libraries. The cookie
+            # must stay referenced or the registration is dropped.
+            global _dll_cookie
+            if hasattr(os, 'add_dll_directory'):
+                _dll_cookie = os.add_dll_directory(vlc_path)
+            elif vlc_path not in os.environ.get('PATH', ''):
+                # Pre-3.8 (and macOS) fallback: search order via PATH
+                os.environ['PATH'] = vlc_path + os.pathsep + os.environ.get('PATH', '')
+
+            # Set VLC plugin path
+            os.environ['VLC_PLUGIN_PATH'] = os.path.join(vlc_path, "plugins")
+        else:
+            logger.warning(f"Bundled VLC not found at {vlc_path}, using system VLC")
+    else:
+        logger.info("Using system VLC (Linux)")
+
+    import vlc
+    return vlc
+
 
 class VLCMediaPlayerWidget(MediaPlayerInterface):
     """
@@ -24,83 +93,62 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
     VLC must be installed on the system.
     """
 
+    # Options passed to vlc.Instance(). VLC's defaults keep ~1s of
+    # demux buffer, which is all flushed and refilled on every seek;
+    # for a local-file scrubbing UI small caches cut hundreds of ms
+    # off each seek. Class-level so tests and subclasses can override.
+    VLC_INSTANCE_OPTIONS = [
+        '--file-caching=150',
+        '--network-caching=150',
+        '--live-caching=150',
+        '--clock-jitter=0',
+        '--clock-synchro=0',
+        '--no-video-title-show',
+        '--quiet',
+    ]
+
+    # Step size for the synthetic reverse-playback loop. Every set_time
+    # makes VLC seek to the prior keyframe and decode forward, so
+    # stepping by typical H.264 keyframe spacing (~2s GOPs) costs one
+    # decoder flush per GOP instead of ten per second
+    REVERSE_STEP_MS = 2000
+
+    # libVLC event callbacks arrive on VLC's own threads; these signals
+    # marshal the values onto the Qt thread before any widget is touched
+    _time_changed = pyqtSignal(int)
+    _position_changed = pyqtSignal(int)
+    _end_reached = pyqtSignal()
+    _media_parsed = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.video_path = None
+        self._media = None
         self.is_playing = False
         self.is_reverse_playing = False
         self.reverse_speed = 1.0  # Multiplier for reverse speed
 
-        # Set up bundled VLC path (Windows only, Linux uses system VLC)
-        if getattr(sys, 'frozen', False):
-            # Running as compiled executable
-            app_dir = sys._MEIPASS
-        else:
-            # Running as script - go up one level from video_player/ directory
-            app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-        platform = sys.platform
-        if platform.startswith('win'):
-            platform_dir = "win32"
-            lib_name = "libvlc.dll"
-        elif platform.startswith('darwin'):
-            platform_dir = "darwin"
-            lib_name = "libvlc.dylib"
-        else:
-            # Linux - use system VLC
-            platform_dir = None
-            lib_name = None
+        # The total duration only changes on load, but the time label is
+        # refreshed on every playback tick; cache its formatted half
+        self._cached_length_ms = -1
+        self._cached_length_str = "00:00:00.000"
 
-        # Import VLC
-        try:
-            # Try bundled VLC first (Windows/macOS)
-            if platform_dir:
-                vlc_path = os.path.join(app_dir, "bin", platform_dir, "vlc")
-                vlc_lib_path = os.path.join(vlc_path, lib_name)
-                vlc_plugin_path = os.path.join(vlc_path, "plugins")
-
-                if os.path.exists(vlc_lib_path):
-                    logger.info(f"Using bundled VLC from {vlc_path}")
-
-                    # Add VLC directory to PATH so python-vlc can find the libraries
-                    if vlc_path not in os.environ.get('PATH', ''):
-                        os.environ['PATH'] = vlc_path + os.pathsep + os.environ.get('PATH', '')
-
-                    # Set VLC plugin path
-                    os.environ['VLC_PLUGIN_PATH'] = vlc_plugin_path
-
-                    # Import vlc module and explicitly preload DLLs
-                    import ctypes
-
-                    # Preload libvlccore.dll first (libvlc.dll depends on it)
-                    vlc_core_path = os.path.join(vlc_path, "libvlccore.dll")
-                    try:
-                        vlc_core_dll = ctypes.CDLL(vlc_core_path)
-                    except Exception as e:
-                        logger.error(f"Failed to load libvlccore.dll: {e}")
-
-                    # Then load libvlc.dll
-                    try:
-                        vlc_dll = ctypes.CDLL(vlc_lib_path)
-                    except Exception as e:
-                        logger.error(f"Failed to load libvlc.dll: {e}")
-
-                    # Now import python-vlc
-                    import vlc
-
-                    # Create instance
-                    self.instance = vlc.Instance()
-                else:
-                    logger.warning(f"Bundled VLC not found at {vlc_path}, using system VLC")
-                    import vlc
-                    self.instance = vlc.Instance()
-            else:
-                # Linux - use system VLC
-                logger.info("Using system VLC (Linux)")
-                import vlc
-                self.instance = vlc.Instance()
+        # Last values pushed to the widgets; setValue/setText schedule a
+        # repaint even when nothing changed, so no-op updates are skipped
+        self._last_slider_value = -1
+        self._last_time_text = ""
+
+        # Detect the platform once; init_ui branches on these instead
+        # of re-checking sys.platform
+        self._is_win = sys.platform.startswith('win')
+        self._is_mac = sys.platform == 'darwin'
 
+        # Import VLC; discovery and environment setup are cached
+        # module-wide, so additional widgets skip straight to here
+        try:
+            vlc = _load_vlc()
             self.vlc = vlc
+            self.instance = vlc.Instance(self.VLC_INSTANCE_OPTIONS)
 
             # Check if instance was created successfully
             if self.instance is None:
@@ -110,16 +158,57 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
 
             if self.player is None:
                 raise Exception("Failed to create media player - player is None")
+
+            # Event types resolved once; every attach/detach site uses
+            # these instead of walking vlc.EventType again
+            self._evt_time = vlc.EventType.MediaPlayerTimeChanged
+            self._evt_pos = vlc.EventType.MediaPlayerPositionChanged
+            self._evt_end = vlc.EventType.MediaPlayerEndReached
+            self._evt_parsed = vlc.EventType.MediaParsedChanged
+
+            # Event-driven UI updates: libVLC pushes time/position
+            # changes at its own cadence, so nothing polls while
+            # playing forward and a paused player costs zero wakeups
+            em = self.player.event_manager()
+            em.event_attach(self._evt_time, self._on_vlc_time_changed)
+            em.event_attach(self._evt_pos, self._on_vlc_position_changed)
+            em.event_attach(self._evt_end, self._on_vlc_end_reached)
+            self._event_manager = em
         except Exception as e:
             logger.error(f"Failed to initialize VLC: {e}", exc_info=True)
             self.vlc = None
             self.instance = None
             self.player = None
-
-        # Timer to update UI
+            self._event_manager = None
+
+        # Explicitly queued: the emitters run on libVLC's threads, and a
+        # queued connection guarantees the slots execute on the Qt
+        # thread even if Qt ever misjudges the emitting thread's
+        # affinity (auto-connection decides per-emit)
+        self._time_changed.connect(self._apply_time,
+                                   type=Qt.QueuedConnection)
+        self._position_changed.connect(self._apply_position,
+                                       type=Qt.QueuedConnection)
+        self._end_reached.connect(self._handle_end_reached,
+                                  type=Qt.QueuedConnection)
+        self._media_parsed.connect(self._handle_media_parsed,
+                                   type=Qt.QueuedConnection)
+
+        # Timer for the synthetic reverse-playback loop only; forward
+        # playback is updated by the VLC events above
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_ui)
 
+        # Coalesces the burst of sliderMoved events during a drag into
+        # one seek: every libVLC seek flushes the demuxer and decodes
+        # forward from the prior keyframe, so applying only the latest
+        # position keeps scrubbing smooth on long-GOP content
+        self._pending_seek = -1
+        self._seek_debounce = QTimer()
+        self._seek_debounce.setSingleShot(True)
+        self._seek_debounce.setInterval(60)
+        self._seek_debounce.timeout.connect(self._apply_pending_seek)
+
         self.init_ui()
 
     def init_ui(self):
@@ -127,6 +216,11 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
 
+        # One stylesheet parse for all the bold transport buttons
+        # instead of a per-button setStyleSheet (Qt re-parses and
+        # re-polishes each widget it is set on)
+        self.setStyleSheet('QPushButton[nav="true"] { font-weight: bold; }')
+
         # Video display frame
         self.video_frame = QFrame()
         self.video_frame.setMinimumSize(640, 360)
@@ -134,13 +228,18 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         self.video_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self.video_frame, 1)
 
-        # Attach VLC to the frame
-        if self.player and sys.platform.startswith('win'):
-            self.player.set_hwnd(int(self.video_frame.winId()))
-        elif self.player and sys.platform == 'darwin':
-            self.player.set_nsobject(int(self.video_frame.winId()))
-        elif self.player:
-            self.player.set_xwindow(int(self.video_frame.winId()))
+        # Attach VLC to the frame. winId() can force native-window
+        # creation, so resolve the handle once and keep it
+        if self.player:
+            self._native_win_id = int(self.video_frame.winId())
+            if self._is_win:
+                self.player.set_hwnd(self._native_win_id)
+            elif self._is_mac:
+                self.player.set_nsobject(self._native_win_id)
+            else:
+                self.player.set_xwindow(self._native_win_id)
+        else:
+            self._native_win_id = None
 
         # Time display
         time_layout = QHBoxLayout()
@@ -162,23 +261,30 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         # Playback controls
         controls_layout = QHBoxLayout()
 
+        # Standard icons fetched once; each standardIcon call would
+        # re-rasterize the platform pixmap through the style engine
+        style = self.style()
+        self._icon_play = style.standardIcon(QStyle.SP_MediaPlay)
+        self._icon_pause = style.standardIcon(QStyle.SP_MediaPause)
+        self._icon_stop = style.standardIcon(QStyle.SP_MediaStop)
+
         # Reverse Fast button (<<)
         self.reverse_fast_button = QPushButton("<<")
         self.reverse_fast_button.clicked.connect(self.reverse_fast)
         self.reverse_fast_button.setFixedWidth(40)
-        self.reverse_fast_button.setStyleSheet("font-weight: bold;")
+        self.reverse_fast_button.setProperty("nav", True)
         controls_layout.addWidget(self.reverse_fast_button)
 
         # Reverse Normal button (<)
         self.reverse_button = QPushButton("<")
         self.reverse_button.clicked.connect(self.reverse_normal)
         self.reverse_button.setFixedWidth(40)
-        self.reverse_button.setStyleSheet("font-weight: bold;")
+        self.reverse_button.setProperty("nav", True)
         controls_layout.addWidget(self.reverse_button)
 
         # Play/Pause button
         self.play_button = QPushButton()
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.play_button.setIcon(self._icon_play)
         self.play_button.clicked.connect(self.play_pause)
         self.play_button.setFixedWidth(40)
         self.play_button.setEnabled(False)
@@ -188,19 +294,19 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         self.reset_speed_button = QPushButton(">")
         self.reset_speed_button.clicked.connect(self.reset_speed)
         self.reset_speed_button.setFixedWidth(40)
-        self.reset_speed_button.setStyleSheet("font-weight: bold;")
+        self.reset_speed_button.setProperty("nav", True)
         controls_layout.addWidget(self.reset_speed_button)
 
         # Increase Speed button
         self.increase_speed_button = QPushButton(">>")
         self.increase_speed_button.clicked.connect(self.increase_speed)
         self.increase_speed_button.setFixedWidth(40)
-        self.increase_speed_button.setStyleSheet("font-weight: bold;")
+        self.increase_speed_button.setProperty("nav", True)
         controls_layout.addWidget(self.increase_speed_button)
 
         # Stop button
         stop_button = QPushButton()
-        stop_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        stop_button.setIcon(self._icon_stop)
         stop_button.clicked.connect(self.stop)
         stop_button.setFixedWidth(40)
         controls_layout.addWidget(stop_button)
@@ -211,10 +317,18 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         speed_label = QLabel("Speed:")
         controls_layout.addWidget(speed_label)
 
+        # Numeric rates kept in a parallel list so a speed change is an
+        # index lookup instead of a per-change string parse
+        self._speed_values = [0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 4.0,
+                              8.0, 16.0, 32.0, 64.0]
+        self._one_x_index = self._speed_values.index(1.0)
+
         self.speed_combo = QComboBox()
-        self.speed_combo.addItems(["0.25x", "0.5x", "0.75x", "1x", "1.5x", "2x", "3x", "4x", "8x", "16x", "32x", "64x"])
-        self.speed_combo.setCurrentText("1x")
-        self.speed_combo.currentTextChanged.connect(self.on_speed_changed)
+        for value in self._speed_values:
+            label = f"{int(value)}x" if value == int(value) else f"{value}x"
+            self.speed_combo.addItem(label)
+        self.speed_combo.setCurrentIndex(self._one_x_index)
+        self.speed_combo.currentIndexChanged.connect(self._on_speed_index_changed)
         self.speed_combo.setFixedWidth(70)
         controls_layout.addWidget(self.speed_combo)
 
@@ -250,14 +364,24 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
             self.video_path = video_path
             media = self.instance.media_new(video_path)
             self.player.set_media(media)
-
-            # Parse media to get duration
-            media.parse()
-
-            # Enable controls
-            self.play_button.setEnabled(True)
-            self.mark_start_button.setEnabled(True)
-            self.mark_end_button.setEnabled(True)
+            self._media = media
+
+            # Force the duration cache to be refetched for the new file
+            self._cached_length_ms = -1
+
+            # Parse asynchronously (bounded at 3s) so a slow file - a
+            # network share over VPN, say - doesn't freeze the Qt event
+            # loop the way the deprecated blocking parse() did; the
+            # MediaParsedChanged event enables the controls once the
+            # duration is known
+            media.event_manager().event_attach(
+                self._evt_parsed, self._on_vlc_media_parsed
+            )
+            media.parse_with_options(
+                self.vlc.MediaParseFlag.local
+                | self.vlc.MediaParseFlag.fetch_local,
+                3000
+            )
 
             logger.info(f"Video loaded successfully: {video_path}")
             return True
@@ -275,21 +399,23 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         if self.is_reverse_playing:
             self.is_reverse_playing = False
 
-        if self.player.is_playing() or self.is_playing:
+        # self.is_playing is maintained by every transition path
+        # (play_pause, stop, reverse_*, end-reached), so the extra
+        # player.is_playing() FFI call added nothing but a window for
+        # the two views to disagree transiently
+        if self.is_playing:
             self.player.pause()
             self.is_playing = False
             self.timer.stop()
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self.play_button.setIcon(self._icon_play)
         else:
             # If playing at faster than 1x, reset to 1x
-            current_speed = self.speed_combo.currentText()
-            if current_speed != "1x":
-                self.speed_combo.setCurrentText("1x")
+            if self.speed_combo.currentIndex() != self._one_x_index:
+                self.speed_combo.setCurrentIndex(self._one_x_index)
 
             self.player.play()
             self.is_playing = True
-            self.timer.start(100)  # Update every 100ms
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+            self.play_button.setIcon(self._icon_pause)
 
     def stop(self):
         """Stop playback."""
@@ -300,17 +426,27 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         self.is_playing = False
         self.is_reverse_playing = False
         self.timer.stop()
-        self.position_slider.setValue(0)
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        with QSignalBlocker(self.position_slider):
+            self.position_slider.setValue(0)
+        self._last_slider_value = 0
+        self.play_button.setIcon(self._icon_play)
 
     def seek_to_position(self, value):
-        """Seek to a specific position from slider."""
+        """Queue a seek from the slider (coalesced while dragging)."""
         if not self.player or not self.player.get_length():
             return
 
-        # Convert slider position (0-1000) to time position (0.0-1.0)
-        position = value / 1000.0
-        self.player.set_position(position)
+        # Only remember the position here; the debounce timer applies
+        # the newest one once the drag pauses or the slider is released
+        self._pending_seek = value
+        self._seek_debounce.start()
+
+    def _apply_pending_seek(self):
+        """Apply the most recent queued slider position as one seek."""
+        if self.player and self._pending_seek >= 0:
+            # Convert slider position (0-1000) to time position (0.0-1.0)
+            self.player.set_position(self._pending_seek / 1000.0)
+            self._pending_seek = -1
 
     def seek_to_timestamp(self, timestamp: str):
         """Seek to a specific timestamp (HH:MM:SS.mmm format)."""
@@ -334,15 +470,17 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         """Called when user releases slider."""
         self.slider_being_dragged = False
 
-    def on_speed_changed(self, speed_text: str):
-        """Handle playback speed change."""
+        # Flush any queued seek immediately so the release lands at the
+        # final position instead of waiting out the debounce interval
+        self._seek_debounce.stop()
+        self._apply_pending_seek()
+
+    def _on_speed_index_changed(self, index: int):
+        """Handle playback speed change via the rate table."""
         if not self.player:
             return
 
-        # Parse speed (e.g., "2x" -> 2.0)
-        speed_str = speed_text.replace('x', '')
-        new_speed = float(speed_str)
-        self.player.set_rate(new_speed)
+        self.player.set_rate(self._speed_values[index])
 
     def increase_speed(self):
         """Increase playback speed to the next level."""
@@ -352,7 +490,7 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
 
     def reset_speed(self):
         """Reset playback speed to 1x without pausing."""
-        self.speed_combo.setCurrentText("1x")
+        self.speed_combo.setCurrentIndex(self._one_x_index)
 
     def reverse_normal(self):
         """Play video in reverse at normal speed."""
@@ -367,9 +505,9 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         self.reverse_speed = 1.0
         self.is_playing = True
 
-        # Start the update timer
-        self.timer.start(100)
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+        # Start the reverse seek loop, one tick per keyframe interval
+        self.timer.start(self.REVERSE_STEP_MS)
+        self.play_button.setIcon(self._icon_pause)
 
     def reverse_fast(self):
         """Play video in reverse at fast speed (4x)."""
@@ -384,46 +522,123 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         self.reverse_speed = 4.0
         self.is_playing = True
 
-        # Start the update timer
-        self.timer.start(100)
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+        # Start the reverse seek loop, one tick per keyframe interval
+        self.timer.start(self.REVERSE_STEP_MS)
+        self.play_button.setIcon(self._icon_pause)
 
-    def update_ui(self):
-        """Update UI elements during playback."""
-        if not self.player:
+    # --- libVLC callbacks: run on a VLC thread, so they only emit ---
+
+    def _on_vlc_time_changed(self, event):
+        self._time_changed.emit(event.u.new_time)
+
+    def _on_vlc_position_changed(self, event):
+        # Scale to the slider's 1001 integer positions here so events
+        # that land on the same notch never cross into the Qt event
+        # loop at all (reading the plain int cache is GIL-safe)
+        new_value = int(event.u.new_position * 1000)
+        if new_value != self._last_slider_value:
+            self._position_changed.emit(new_value)
+
+    def _on_vlc_end_reached(self, event):
+        self._end_reached.emit()
+
+    def _on_vlc_media_parsed(self, event):
+        self._media_parsed.emit()
+
+    # --- Qt-thread slots fed by the signals above ---
+
+    def _apply_time(self, current_time: int):
+        """Update the time display."""
+        if not self.isVisible():
             return
 
-        # Handle reverse playback by seeking backward
-        if self.is_reverse_playing:
-            current_time = self.player.get_time()
-            if current_time is not None and current_time > 0:
-                # Seek backward by 100ms * reverse_speed
-                jump_back = int(100 * self.reverse_speed)
-                new_time = max(0, current_time - jump_back)
-                self.player.set_time(new_time)
-
-                # Stop if we hit the beginning
-                if new_time == 0:
-                    self.is_reverse_playing = False
-                    self.player.pause()
-                    self.is_playing = False
-                    self.timer.stop()
-                    self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-
-        # Update slider position (unless user is dragging it)
-        if not self.slider_being_dragged:
-            position = self.player.get_position()  # Returns 0.0 to 1.0
-            if position >= 0:
-                self.position_slider.setValue(int(position * 1000))
-
-        # Update time display
-        current_time = self.player.get_time()  # milliseconds
-        length = self.player.get_length()  # milliseconds
+        # get_length is a ctypes roundtrip into libVLC; poll it only
+        # until the duration is known, then reuse the cached value
+        # (load_video resets the cache for each new file)
+        length = self._cached_length_ms
+        if length <= 0:
+            length = self.player.get_length() if self.player else 0
+            if length > 0:
+                self._cached_length_ms = length
+                self._cached_length_str = self.milliseconds_to_timestamp(length)
 
         if current_time >= 0 and length > 0:
             current_str = self.milliseconds_to_timestamp(current_time)
-            total_str = self.milliseconds_to_timestamp(length)
-            self.time_label.setText(f"{current_str} / {total_str}")
+            text = f"{current_str} / {self._cached_length_str}"
+            if text != self._last_time_text:
+                self._last_time_text = text
+                self.time_label.setText(text)
+
+    def _apply_position(self, slider_value: int):
+        """Update the slider position (unless user is dragging it)."""
+        if not self.isVisible():
+            return
+        if not self.slider_being_dragged and slider_value >= 0:
+            if slider_value != self._last_slider_value:
+                self._last_slider_value = slider_value
+                # Programmatic ticks shouldn't fan out through Qt's
+                # signal machinery; only user drags are real events
+                with QSignalBlocker(self.position_slider):
+                    self.position_slider.setValue(slider_value)
+
+    def _handle_media_parsed(self):
+        """Enable the controls once the media's metadata is available."""
+        self.play_button.setEnabled(True)
+        self.mark_start_button.setEnabled(True)
+        self.mark_end_button.setEnabled(True)
+
+    def _handle_end_reached(self):
+        """Reset playback state when the media finishes."""
+        self.is_playing = False
+        self.is_reverse_playing = False
+        self.timer.stop()
+        self.play_button.setIcon(self._icon_play)
+
+    def update_ui(self):
+        """Drive the synthetic reverse-playback loop (timer ticks)."""
+        if not self.player or not self.is_reverse_playing:
+            return
+
+        # Handle reverse playback by seeking backward one keyframe
+        # interval per tick (scaled by the reverse speed)
+        current_time = self.player.get_time()
+        if current_time is not None and current_time > 0:
+            jump_back = int(self.REVERSE_STEP_MS * self.reverse_speed)
+            new_time = max(0, current_time - jump_back)
+            self.player.set_time(new_time)
+
+            # Stop if we hit the beginning
+            if new_time == 0:
+                self.is_reverse_playing = False
+                self.player.pause()
+                self.is_playing = False
+                self.timer.stop()
+                self.play_button.setIcon(self._icon_play)
+
+            # The player is paused during reverse, so VLC emits no
+            # time/position events for the synthetic seeks; refresh
+            # the slider and time display from here. The fraction is
+            # derived from new_time rather than get_position() - one
+            # FFI call fewer, and the seek may not have landed yet
+            if self._cached_length_ms > 0:
+                self._apply_position(new_time * 1000 // self._cached_length_ms)
+            self._apply_time(new_time)
+
+    def hideEvent(self, event):
+        """Stop the reverse-seek loop while the widget is hidden.
+
+        Each reverse tick costs a decoder flush with nothing on screen
+        to show for it; the position simply holds until the widget is
+        shown again. Forward playback is event-driven and unaffected.
+        """
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume the reverse-seek loop when the widget reappears."""
+        if self.is_reverse_playing:
+            self.timer.start(self.REVERSE_STEP_MS)
+        super().showEvent(event)
 
     def get_current_timestamp(self) -> str:
         """Get the current playback position as a timestamp string."""
@@ -436,13 +651,40 @@ class VLCMediaPlayerWidget(MediaPlayerInterface):
         return "00:00:00.000"
 
     def close_player(self):
-        """Clean up the media player."""
+        """Clean up the media player.
+
+        Everything is detached and nulled explicitly: leaving the
+        media, event manager, or player to reference-cycle collection
+        can keep libVLC decoder threads alive long after the widget is
+        gone. Safe to call more than once.
+        """
         self.timer.stop()
+        self._seek_debounce.stop()
+
+        if self._event_manager:
+            self._event_manager.event_detach(self._evt_time)
+            self._event_manager.event_detach(self._evt_pos)
+            self._event_manager.event_detach(self._evt_end)
+            self._event_manager = None
+
+        if self._media is not None:
+            self._media.event_manager().event_detach(self._evt_parsed)
+            self._media = None
+
         if self.player:
             self.player.stop()
+            self.player.set_media(None)
             self.player.release()
+            self.player = None
+
         if self.instance:
             self.instance.release()
+            self.instance = None
+
+    def closeEvent(self, event):
+        """Release VLC resources when Qt closes the widget."""
+        self.close_player()
+        super().closeEvent(event)
 
     def mark_start(self):
         """Emit signal with current timestamp for marking start time."""